@@ -10,16 +10,32 @@ from tkinter import font as tkfont
 import time
 import json
 import os
+import re
+import functools
+import queue
+import threading
 
-# Optional: use real TTS so you can hear the menu and order
-_voice_system = None
+# Optional: orjson parses config faster; fall back to the stdlib
 try:
-    from drive_thru_system import DriveThruSystem
-    _voice_system = DriveThruSystem()
-    if not getattr(_voice_system, "tts_method", None):
-        _voice_system = None
-except Exception as e:
-    print("Voice disabled in simulation:", e)
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+@functools.lru_cache(maxsize=1)
+def _get_voice_system():
+    """Optional: real TTS so you can hear the menu and order. Built on first use (from the speech worker),
+    so the window opens without waiting for mic calibration and voice setup."""
+    try:
+        from drive_thru_system import DriveThruSystem
+        voice_system = DriveThruSystem()
+        if getattr(voice_system, "tts_method", None):
+            return voice_system
+    except Exception as e:
+        print("Voice disabled in simulation:", e)
+    return None
+
 
 # Scale factor (bigger = larger window and drawing frame)
 SCALE = 2.8
@@ -43,6 +59,10 @@ ORDER_BOOTH_X = s(252)
 COLLECTION_X = s(362)
 BOOTH_W, BOOTH_H = s(55), s(75)
 CANVAS_W, CANVAS_H = s(420), s(220)
+# Car travel along the lane: starts with its right edge left of the loop, ends at the lane edge
+CAR_START_X = LOOP_X - CAR_LENGTH - s(8)
+CAR_END_X = s(405) - CAR_LENGTH
+CAR_Y = s(100) - CAR_HEIGHT // 2
 
 # Car progress: 0=before sensor, 0.2=on sensor, 0.45=at order booth, 0.85=at collection
 POS_SENSOR = 0.18
@@ -59,11 +79,13 @@ MENU_ITEMS = [
 ]
 
 
+@functools.lru_cache(maxsize=1)
 def load_menu_from_config():
+    """Menu lines for the simulation, read from config.json once (tuple so the cached value can't be mutated)."""
     try:
         path = os.path.join(os.path.dirname(__file__), "config.json")
-        with open(path) as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            data = _json_loads(f.read())
         offers = data.get("special_offers", [])
         if offers:
             out = []
@@ -73,10 +95,34 @@ def load_menu_from_config():
                     out.append(parts[0] + " - " + parts[-1] if len(parts) >= 2 else o[:45])
                 else:
                     out.append(o[:45])
-            return out
+            return tuple(out)
     except Exception:
         pass
-    return MENU_ITEMS
+    return tuple(MENU_ITEMS)
+
+
+@functools.lru_cache(maxsize=1)
+def clean_menu_items(items):
+    """Menu choices as spoken/shown: stripped, without any "Number N: " prefix (computed once per menu)."""
+    out = []
+    for name in items[:MENU_CHOICES]:
+        clean = name.strip()
+        if clean.lower().startswith("number ") and ": " in clean:
+            clean = clean.split(": ", 1)[1]
+        out.append(clean)
+    return tuple(out)
+
+# Phrase boundary for streamed speech: sentence punctuation followed by whitespace (keeps "1, 2, 3" and "3.5" whole)
+_PHRASE_END = re.compile(r"(?<=[.;!?])\s+")
+
+
+def _tcl_word(value) -> str:
+    """Quote a value as a single Tcl word for _batch_create (our literals never contain braces)."""
+    if isinstance(value, (tuple, list)):
+        return "{" + " ".join(_tcl_word(v) for v in value) + "}"
+    if isinstance(value, str):
+        return "{" + value + "}"
+    return str(value)
 
 
 class DriveThruSimulation:
@@ -85,8 +131,25 @@ class DriveThruSimulation:
         self.root.title("KFC Drive-Through - Full Flow Simulation")
         self.root.geometry(f"{s(800)}x{s(560)}")
         self.root.configure(bg="#2d2d2d")
+        # Canvas fonts: one named Tk font per spec, shared by every item that uses it
+        self._font_bold_10 = tkfont.Font(self.root, family="Segoe UI", size=s(10), weight="bold")
+        self._font_bold_9 = tkfont.Font(self.root, family="Segoe UI", size=s(9), weight="bold")
+        self._font_bold_8 = tkfont.Font(self.root, family="Segoe UI", size=s(8), weight="bold")
+        self._font_bold_7 = tkfont.Font(self.root, family="Segoe UI", size=s(7), weight="bold")
+        self._font_7 = tkfont.Font(self.root, family="Segoe UI", size=s(7))
+        self._font_sign = tkfont.Font(self.root, family="Segoe UI", size=6, weight="bold")
+        self._font_mono_9 = tkfont.Font(self.root, family="Consolas", size=9)
+        self._font_timer = tkfont.Font(self.root, family="Consolas", size=s(12), weight="bold")
 
         self.menu_items = load_menu_from_config()
+        self.menu_items_clean = clean_menu_items(self.menu_items)
+        # The menu read-out never changes for a loaded menu: build it once, insert it in one call
+        self._menu_readout_text = (
+            "Reading out menu (read here if you can't hear):\n\n"
+            "Welcome to KFC Westlands. This is our specials today.\n\n"
+            + "".join(f"  {i}. {name}\n" for i, name in enumerate(self.menu_items_clean, 1))
+            + "\nSay 1, 2, 3, 4, or 5 for your choice. Say 0 to hear the menu again. Say 6 to cancel your order."
+        )
 
         # State
         self.car_progress = -0.05  # off screen to start
@@ -98,6 +161,15 @@ class DriveThruSimulation:
         self.car_at_collection = False
         self.client_response = ""  # what the client said (e.g. "Number 1")
         self.car_number = 0  # Car #1, #2 for order screen
+        self._after_id = None  # pending root.after() step of the running flow
+        self._flow_id = 0  # bumped by reset() so stale speech callbacks are ignored
+        # TTS runs on a worker thread so the animation and timer are never blocked by speech
+        self._speech_queue = queue.Queue()
+        threading.Thread(target=self._speech_worker, daemon=True).start()
+        self._last_base_state = (False, False)  # (base_station_on, loop_triggered) as first drawn
+        # What the order display currently shows, so _update_order_display only writes the delta
+        self._order_display_state = {"mode": "empty", "car_id": None, "items_written": 0, "footer_written": False}
+        self._order_screen_lines = []
 
         # Top row: drawing (canvas) + right controls
         top = tk.Frame(self.root, bg="#2d2d2d")
@@ -112,9 +184,12 @@ class DriveThruSimulation:
         self.canvas.pack()
         self.timer_start = None
         self.timer_running = False
+        self._last_timer_text = "0:00"  # timer_text is created showing 0:00
         self._draw_static()
         self._draw_timer()
-        self._draw_car()
+        self._create_car_items()
+        # Loop, speaker, base station drawn once, after the car, so they stay on top of it
+        self._draw_equipment_overlay()
 
         right = tk.Frame(top, bg="#2d2d2d", width=s(280))
         right.pack(side="right", fill="y")
@@ -162,25 +237,52 @@ class DriveThruSimulation:
         self.status.pack(pady=6)
 
     def _speak_in_sim(self, text: str):
-        """Speak text in simulation if TTS is available."""
-        if _voice_system and getattr(_voice_system, "tts_method", None):
+        """Speak text in simulation if TTS is available (blocking; runs on the speech worker)."""
+        vs = _get_voice_system()
+        if vs is not None and getattr(vs, "tts_method", None):
             try:
-                _voice_system.speak(text)
+                vs.speak_blocking(text)  # SAPI lives on the voice system's own thread
             except Exception as e:
                 print("TTS in sim:", e)
 
-    def _speak_menu_sync(self):
-        """Speak the full menu (welcome + 5 items). Say 1-5 to order, 0 to repeat, 6 to cancel."""
-        if not _voice_system or not getattr(_voice_system, "tts_method", None):
-            return
-        self._speak_in_sim("Welcome to KFC Westlands. This is our specials today.")
-        for i, name in enumerate(self.menu_items[:MENU_CHOICES], 1):
-            # Speak item only (no "Number X" prefix to avoid repetition)
-            clean = name.strip()
-            if clean.lower().startswith("number ") and ": " in clean:
-                clean = clean.split(": ", 1)[1]
-            self._speak_in_sim(clean)
-        self._speak_in_sim("Say 1, 2, 3, 4, or 5 for your choice. Say 0 to hear the menu again. Say 6 to cancel your order. I am listening now.")
+    def _speech_worker(self):
+        """Speak queued chunks in order off the Tk thread; queued callbacks are handed back via root.after."""
+        while True:
+            item = self._speech_queue.get()
+            if callable(item):
+                self.root.after(0, item)
+            else:
+                self._speak_in_sim(item)
+
+    def _say(self, *chunks: str, on_done=None):
+        """Queue chunks for the speech worker; on_done runs on the Tk thread once they have all been spoken."""
+        for chunk in chunks:
+            self._speech_queue.put(chunk)
+        if on_done:
+            flow = self._flow_id
+            self._speech_queue.put(lambda: flow == self._flow_id and on_done())
+
+    def _clear_speech_queue(self):
+        """Drop chunks not yet spoken (the one being spoken finishes)."""
+        while True:
+            try:
+                self._speech_queue.get_nowait()
+            except queue.Empty:
+                return
+
+    def _speak_streamed(self, text: str, on_done=None):
+        """Queue text phrase by phrase so playback of the first phrase starts before the rest is synthesized."""
+        self._say(*(p for p in _PHRASE_END.split(text.strip()) if p), on_done=on_done)
+
+    def _speak_menu_sync(self, on_done=None):
+        """Queue the full menu (welcome, one chunk per item, prompt). Say 1-5 to order, 0 to repeat, 6 to cancel."""
+        # No TTS check here: the worker builds the voice system lazily and skips text it cannot speak
+        # Short greeting first so audio starts while the menu items are still queued behind it
+        self._speak_streamed("Welcome to KFC Westlands. This is our specials today.")
+        # Speak item only (no "Number X" prefix to avoid repetition)
+        self._say(*self.menu_items_clean)
+        self._speak_streamed("Say 1, 2, 3, 4, or 5 for your choice. Say 0 to hear the menu again. Say 6 to cancel your order. I am listening now.",
+                             on_done=on_done)
 
     def _tick_timer(self):
         """Schedule timer updates while running."""
@@ -189,6 +291,40 @@ class DriveThruSimulation:
         self._update_timer()
         self.root.after(200, self._tick_timer)
 
+    def _schedule(self, delay: int, callback, *args):
+        """Schedule the next flow/animation step; Reset cancels whatever is pending."""
+        self._after_id = self.root.after(delay, callback, *args)
+
+    def _cancel_scheduled(self):
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+
+    def _animate_car(self, target: float, steps: int, delay: int, on_done=None):
+        """Drive the car from its current progress to target in steps frames, one frame per root.after(delay)."""
+        # One tick chain at a time: a click during a running segment replaces it instead of adding a second
+        # chain that _after_id (and so Reset) would lose track of
+        self._cancel_scheduled()
+        start = self.car_progress
+        # Whole trajectory up front; each frame just indexes it (last frame lands exactly on target)
+        frames = [start + (target - start) * i / steps for i in range(1, steps)]
+        frames.append(target)
+        last = len(frames) - 1
+
+        def tick(frame_i):
+            self.car_progress = frames[frame_i]
+            self._draw_car()
+            self.canvas.update_idletasks()
+            if frame_i < last:
+                self._schedule(delay, tick, frame_i + 1)
+            elif on_done:
+                on_done()
+
+        tick(0)
+
     def run_full_flow(self):
         """One button: car goes through entire ordering by itself; timer runs in real time."""
         self.reset()
@@ -198,205 +334,192 @@ class DriveThruSimulation:
         self.start_btn.config(state="disabled")
         self.status.config(text="Running full flow…")
 
-        def step():
-            # 1) Car onto sensor → loop → base station
-            self.status.config(text="Car on sensor → loop → base station ON")
-            for step_i in range(1, 15):
-                self.car_progress = (step_i / 15) * POS_SENSOR
-                self._draw_car()
-                self._update_timer()
-                self.root.update()
-                time.sleep(0.04)
-            self.car_progress = POS_SENSOR
+        def on_sensor():
             self.loop_triggered = True
             self.base_station_on = True
             self.menu_read = True
-            self._draw_car()
             self._update_base_station()
-            self._update_timer()
-            self.root.update()
             self.status.config(text="Car on sensor — timer started. Speaker: welcome and menu by voice (1–5 order, 0 repeat, 6 cancel).")
-            self.root.update()
             # Show menu text below drawing (so you can read when you can't hear)
             self._show_menu_read_out_below()
-            # Speak the menu so you can hear it
-            self._speak_menu_sync()
-            for _ in range(12):
-                time.sleep(0.1)
-                self._update_timer()
-                self.root.update()
+            # Speak the menu so you can hear it; the timer keeps ticking while it plays
+            self._speak_menu_sync(on_done=lambda: self._schedule(1200, order_confirmed))
+
+        def order_confirmed():
             # 2) Client picks a number → Order confirmed, Car #1, order on screen, human prepares
             self.client_response = "Number 1"
             self.car_number = 1
             self.order_items.append((0, self.menu_items[0]))
             self.order_confirmed = True
             self._update_order_display()
-            # Speak order confirmation so you can hear it
-            self._speak_in_sim("Order confirmed. Car number one.")
             self.status.config(text="Order confirmed. Car #1. Order on screen. Human preparing — drive to pick up.")
-            self._update_timer()
-            self.root.update()
-            time.sleep(1.0)
-
-            # 3) Drive to order window (then to pick up)
-            for step_i in range(1, 28):
-                t = step_i / 28
-                self.car_progress = POS_SENSOR + (POS_ORDER - POS_SENSOR) * t
-                self._draw_car()
-                self._update_timer()
-                self.root.update()
-                time.sleep(0.035)
-            self.car_progress = POS_ORDER
-            self._draw_car()
-            self._update_timer()
-            self.root.update()
-            for _ in range(10):
-                time.sleep(0.1)
-                self._update_timer()
-                self.root.update()
+            # Speak order confirmation so you can hear it, then 3) drive to order window (then to pick up)
+            self._say("Order confirmed. Car number one.", on_done=lambda: self._schedule(
+                1000, self._animate_car, POS_ORDER, 28, 35, lambda: self._schedule(1000, to_collection)))
+
+        def to_collection():
             # 4) Car moves to pick up — collect order and pay
             self.status.config(text="Car moving to pick up — collect order and pay.")
-            for step_i in range(1, 35):
-                t = step_i / 35
-                self.car_progress = POS_ORDER + (POS_COLLECTION - POS_ORDER) * t
-                self._draw_car()
-                self._update_timer()
-                self.root.update()
-                time.sleep(0.035)
-            self.car_progress = POS_COLLECTION
+            self._animate_car(POS_COLLECTION, 35, 35, done)
+
+        def done():
             self.car_at_collection = True
-            self._draw_car()
-            self._update_timer()
             self.timer_running = False
             self.status.config(text="Done. Car at pick up — customer collects order and pays.")
             self.start_btn.config(state="normal")
 
-        # Run in a short delay so UI updates
-        self.root.after(10, step)
+        # 1) Car onto sensor → loop → base station
+        self.status.config(text="Car on sensor → loop → base station ON")
+        self._schedule(10, self._animate_car, POS_SENSOR, 15, 40, on_sensor)
+
+    def _batch_create(self, items):
+        """Create many canvas items in one Tcl round-trip. items: (type, coords, options) tuples."""
+        w = str(self.canvas)
+        cmds = []
+        for kind, coords, opts in items:
+            args = " ".join(str(v) for v in coords)
+            options = " ".join(f"-{k} {_tcl_word(v)}" for k, v in opts.items())
+            cmds.append(f"{w} create {kind} {args} {options}")
+        self.canvas.tk.eval("\n".join(cmds))
 
     def _draw_static(self):
         """Simple, clean 2D scene: sky, ground, lane, building, ORDER, PICK UP, KFC, order screen."""
-        c = self.canvas
+        items = []
         # Sky — flat
-        c.create_rectangle(0, 0, CANVAS_W, CANVAS_H, fill="#b0d4e8", outline="")
+        items.append(("rectangle", (0, 0, CANVAS_W, CANVAS_H), dict(fill="#b0d4e8", outline="")))
         # Ground
-        c.create_rectangle(0, s(148), CANVAS_W, CANVAS_H, fill="#3a5c32", outline="")
+        items.append(("rectangle", (0, s(148), CANVAS_W, CANVAS_H), dict(fill="#3a5c32", outline="")))
         # Lane — simple grey, white edges, yellow curb
-        c.create_rectangle(s(25), s(48), s(415), s(152), fill="#444", outline="#333", width=1)
-        c.create_rectangle(s(35), s(55), s(405), s(145), fill="#3a3a3a", outline="")
+        items.append(("rectangle", (s(25), s(48), s(415), s(152)), dict(fill="#444", outline="#333", width=1)))
+        items.append(("rectangle", (s(35), s(55), s(405), s(145)), dict(fill="#3a3a3a", outline="")))
         for i in range(3):
             y = s(72 + i * 28)
-            c.create_line(s(50), y, s(390), y, fill="#666", dash=(6, 8), width=1)
-        c.create_line(s(35), s(55), s(405), s(55), fill="#fff", width=2)
-        c.create_line(s(35), s(145), s(405), s(145), fill="#d4a020", width=2)
+            items.append(("line", (s(50), y, s(390), y), dict(fill="#666", dash=(6, 8), width=1)))
+        items.append(("line", (s(35), s(55), s(405), s(55)), dict(fill="#fff", width=2)))
+        items.append(("line", (s(35), s(145), s(405), s(145)), dict(fill="#d4a020", width=2)))
         # Building — starts after SPEAKER so it doesn't cover it; flat grey, red roof
         b_x, b_y = s(232), s(25)
         b_w, b_h = s(165), s(125)
-        c.create_rectangle(b_x, b_y + s(30), b_x + b_w, b_y + b_h, fill="#555", outline="#444", width=1)
-        c.create_rectangle(b_x - s(2), b_y, b_x + b_w + s(2), b_y + s(28), fill="#a02020", outline="#801818", width=1)
+        items.append(("rectangle", (b_x, b_y + s(30), b_x + b_w, b_y + b_h), dict(fill="#555", outline="#444", width=1)))
+        items.append(("rectangle", (b_x - s(2), b_y, b_x + b_w + s(2), b_y + s(28)), dict(fill="#a02020", outline="#801818", width=1)))
         # ORDER / MENU — clear spacing from road elements
         ow_x = ORDER_BOOTH_X + s(4)
-        c.create_rectangle(ow_x, s(54), ow_x + s(44), s(96), fill="#2a3540", outline="#d4a020", width=1)
-        c.create_text(ORDER_BOOTH_X + BOOTH_W//2, s(72), text="ORDER", fill="#d4a020", font=("Segoe UI", s(10), "bold"))
-        c.create_text(ORDER_BOOTH_X + BOOTH_W//2, s(104), text="Menu · speaker at loop", fill="#8a9a9a", font=("Segoe UI", s(7)))
-        c.create_rectangle(ORDER_BOOTH_X - s(4), s(34), ORDER_BOOTH_X + BOOTH_W + s(4), s(46), fill="#222", outline="#d4a020", width=1)
-        c.create_text(ORDER_BOOTH_X + BOOTH_W//2, s(40), text="MENU", fill="#d4a020", font=("Segoe UI", s(9), "bold"))
+        items.append(("rectangle", (ow_x, s(54), ow_x + s(44), s(96)), dict(fill="#2a3540", outline="#d4a020", width=1)))
+        items.append(("text", (ORDER_BOOTH_X + BOOTH_W//2, s(72)), dict(text="ORDER", fill="#d4a020", font=self._font_bold_10)))
+        items.append(("text", (ORDER_BOOTH_X + BOOTH_W//2, s(104)), dict(text="Menu · speaker at loop", fill="#8a9a9a", font=self._font_7)))
+        items.append(("rectangle", (ORDER_BOOTH_X - s(4), s(34), ORDER_BOOTH_X + BOOTH_W + s(4), s(46)), dict(fill="#222", outline="#d4a020", width=1)))
+        items.append(("text", (ORDER_BOOTH_X + BOOTH_W//2, s(40)), dict(text="MENU", fill="#d4a020", font=self._font_bold_9)))
         # PICK UP
         cw_x = COLLECTION_X + s(4)
-        c.create_rectangle(cw_x, s(54), cw_x + s(44), s(96), fill="#1a2a1a", outline="#5a8a5a", width=1)
-        c.create_text(COLLECTION_X + BOOTH_W//2, s(72), text="PICK UP", fill="#8acc8a", font=("Segoe UI", s(10), "bold"))
-        c.create_text(COLLECTION_X + BOOTH_W//2, s(104), text="Collect & Pay", fill="#6a8a6a", font=("Segoe UI", s(7)))
+        items.append(("rectangle", (cw_x, s(54), cw_x + s(44), s(96)), dict(fill="#1a2a1a", outline="#5a8a5a", width=1)))
+        items.append(("text", (COLLECTION_X + BOOTH_W//2, s(72)), dict(text="PICK UP", fill="#8acc8a", font=self._font_bold_10)))
+        items.append(("text", (COLLECTION_X + BOOTH_W//2, s(104)), dict(text="Collect & Pay", fill="#6a8a6a", font=self._font_7)))
         # KFC sign — clear position, full text visible
         kfc_left, kfc_top = s(368), s(10)
         kfc_w, kfc_h = s(48), s(40)
         kfc_cx = kfc_left + kfc_w // 2
-        c.create_rectangle(kfc_left, kfc_top, kfc_left + kfc_w, kfc_top + kfc_h, fill="#d4a020", outline="#a07818", width=1)
-        c.create_text(kfc_cx, kfc_top + s(12), text="KFC", fill="#1a1a1a", font=("Segoe UI", s(10), "bold"))
-        c.create_text(kfc_cx, kfc_top + s(28), text="DRIVE THRU", fill="#5c4a18", font=("Segoe UI", 6, "bold"))
+        items.append(("rectangle", (kfc_left, kfc_top, kfc_left + kfc_w, kfc_top + kfc_h), dict(fill="#d4a020", outline="#a07818", width=1)))
+        items.append(("text", (kfc_cx, kfc_top + s(12)), dict(text="KFC", fill="#1a1a1a", font=self._font_bold_10)))
+        items.append(("text", (kfc_cx, kfc_top + s(28)), dict(text="DRIVE THRU", fill="#5c4a18", font=self._font_sign)))
         # Order screen — aligned with building, clear border
         os_left, os_top = s(242), s(112)
         os_w, os_h = s(148), s(32)
-        c.create_rectangle(os_left, os_top, os_left + os_w, os_top + os_h, fill="#0c1810", outline="#d4a020", width=1, tags="order_screen_bg")
-        c.create_text(os_left + os_w//2, os_top + os_h//2, text="No order yet", fill="#8acc8a", font=("Consolas", 9), width=os_w - s(12), tags="order_screen_text")
+        items.append(("rectangle", (os_left, os_top, os_left + os_w, os_top + os_h), dict(fill="#0c1810", outline="#d4a020", width=1, tags="order_screen_bg")))
+        items.append(("text", (os_left + os_w//2, os_top + os_h//2), dict(text="No order yet", fill="#8acc8a", font=self._font_mono_9, width=os_w - s(12), tags="order_screen_text")))
+        self._batch_create(items)
 
     def _draw_timer(self):
         """Simple timer box."""
         self.canvas.create_rectangle(s(28), s(6), s(102), s(28), fill="#222", outline="#d4a020", width=1, tags="timer_bg")
-        self.canvas.create_text(s(65), s(17), text="0:00", fill="#d4a020", font=("Consolas", s(12), "bold"), tags="timer_text")
+        self.canvas.create_text(s(65), s(17), text="0:00", fill="#d4a020", font=self._font_timer, tags="timer_text")
 
     def _update_timer(self):
-        """Refresh timer on canvas with real elapsed time."""
+        """Refresh timer on canvas with real elapsed time (skipped when the shown text would not change)."""
+        if self.timer_start is None or not self.timer_running:
+            text = "0:00"
+        else:
+            elapsed = int(time.time() - self.timer_start)
+            text = f"{elapsed // 60}:{elapsed % 60:02d}"
+        if text == self._last_timer_text:
+            return
         try:
-            if self.timer_start is None or not self.timer_running:
-                self.canvas.itemconfig("timer_text", text="0:00")
-                return
-            elapsed = time.time() - self.timer_start
-            m = int(elapsed) // 60
-            s = int(elapsed) % 60
-            self.canvas.itemconfig("timer_text", text=f"{m}:{s:02d}")
+            self.canvas.itemconfig("timer_text", text=text)
+            self._last_timer_text = text
         except tk.TclError:
             pass
 
     def _car_position(self):
         """Car position in 2D (x, y). Car starts fully before LOOP sensor (left of it), then drives right."""
         t = max(0, min(1, self.car_progress))
-        # Start so car's right edge is left of the loop (car is before loop)
-        car_before_loop = LOOP_X - CAR_LENGTH - s(8)
-        lane_end = s(405) - CAR_LENGTH
-        x = car_before_loop + t * (lane_end - car_before_loop)
-        y = s(100) - CAR_HEIGHT // 2
-        return x, y
+        # Scaled lane bounds are module constants so the per-frame path does no s() calls
+        x = CAR_START_X + t * (CAR_END_X - CAR_START_X)
+        return x, CAR_Y
 
-    def _draw_car(self):
-        """Draw car as 2D sedan (body, cabin, windows, wheels) on the lane."""
-        self.canvas.delete("car")
+    def _create_car_items(self):
+        """Create the 2D sedan (body, cabin, windows, wheels) once; _draw_car() only moves it."""
         x, y = self._car_position()
         c = self.canvas
         # Body — cleaner red with subtle outline
-        c.create_rectangle(x, y + s(14), x + CAR_LENGTH, y + CAR_HEIGHT, fill="#b00", outline="#5a0000", width=1, tags="car")
-        c.create_rectangle(x + s(4), y + s(18), x + CAR_LENGTH - s(4), y + CAR_HEIGHT - s(4), fill="#c00", outline="#800", width=1, tags="car")
+        self.car_body_id = c.create_rectangle(x, y + s(14), x + CAR_LENGTH, y + CAR_HEIGHT, fill="#b00", outline="#5a0000", width=1, tags="car")
+        self.car_panel_id = c.create_rectangle(x + s(4), y + s(18), x + CAR_LENGTH - s(4), y + CAR_HEIGHT - s(4), fill="#c00", outline="#800", width=1, tags="car")
         # Cabin / windshield
-        c.create_rectangle(x + s(38), y + s(18), x + CAR_LENGTH - s(12), y + s(28), fill="#3a5068", outline="#2a4050", tags="car")
-        c.create_rectangle(x + s(42), y + s(20), x + CAR_LENGTH - s(16), y + s(26), fill="#5a7088", outline="#3a5068", width=1, tags="car")
+        self.car_cabin_id = c.create_rectangle(x + s(38), y + s(18), x + CAR_LENGTH - s(12), y + s(28), fill="#3a5068", outline="#2a4050", tags="car")
+        self.car_window_id = c.create_rectangle(x + s(42), y + s(20), x + CAR_LENGTH - s(16), y + s(26), fill="#5a7088", outline="#3a5068", width=1, tags="car")
         # Roof
-        c.create_rectangle(x + s(32), y + s(8), x + CAR_LENGTH - s(8), y + s(20), fill="#a00", outline="#600", width=1, tags="car")
+        self.car_roof_id = c.create_rectangle(x + s(32), y + s(8), x + CAR_LENGTH - s(8), y + s(20), fill="#a00", outline="#600", width=1, tags="car")
         # Wheels
-        c.create_oval(x + s(6), y + CAR_HEIGHT - s(8), x + s(22), y + CAR_HEIGHT + s(4), fill="#111", outline="#444", width=1, tags="car")
-        c.create_oval(x + CAR_LENGTH - s(22), y + CAR_HEIGHT - s(8), x + CAR_LENGTH - s(6), y + CAR_HEIGHT + s(4), fill="#111", outline="#444", width=1, tags="car")
+        self.car_wheel_ids = (
+            c.create_oval(x + s(6), y + CAR_HEIGHT - s(8), x + s(22), y + CAR_HEIGHT + s(4), fill="#111", outline="#444", width=1, tags="car"),
+            c.create_oval(x + CAR_LENGTH - s(22), y + CAR_HEIGHT - s(8), x + CAR_LENGTH - s(6), y + CAR_HEIGHT + s(4), fill="#111", outline="#444", width=1, tags="car"),
+        )
         # Lights
-        c.create_oval(x + s(2), y + s(22), x + s(8), y + s(28), fill="#fff8b0", outline="#666", width=1, tags="car")
-        c.create_oval(x + CAR_LENGTH - s(8), y + s(22), x + CAR_LENGTH - s(2), y + s(28), fill="#cc2222", outline="#666", width=1, tags="car")
-        # Draw loop, speaker, base station on top so car never hides them
-        self._draw_equipment_overlay()
+        self.car_light_ids = (
+            c.create_oval(x + s(2), y + s(22), x + s(8), y + s(28), fill="#fff8b0", outline="#666", width=1, tags="car"),
+            c.create_oval(x + CAR_LENGTH - s(8), y + s(22), x + CAR_LENGTH - s(2), y + s(28), fill="#cc2222", outline="#666", width=1, tags="car"),
+        )
+        self._last_car_x = x
+
+    def _draw_car(self):
+        """Move the car items to the current progress along the lane (the car only travels in x)."""
+        x, _ = self._car_position()
+        dx = x - self._last_car_x
+        if dx:
+            self.canvas.move("car", dx, 0)
+            self._last_car_x = x
 
     def _draw_equipment_overlay(self):
         """Simple overlay: LOOP Sensor, Speaker, Base Station; minimal connection lines. Car stays right of these."""
-        c = self.canvas
-        c.delete("equipment")
         line_color = "#5a6a6a"
+        items = []
         # LOOP Sensor — single green box
-        c.create_rectangle(LOOP_X, LOOP_Y, LOOP_X + LOOP_W, LOOP_Y + LOOP_H,
-                          fill="#244a24", outline="#3a6a3a", width=1, tags=("equipment", "sensor_rect"))
-        c.create_text(LOOP_X + LOOP_W//2, LOOP_Y + LOOP_H//2, text="LOOP\nSensor", fill="#8acc8a", font=("Segoe UI", s(8), "bold"), tags="equipment")
+        items.append(("rectangle", (LOOP_X, LOOP_Y, LOOP_X + LOOP_W, LOOP_Y + LOOP_H),
+                      dict(fill="#244a24", outline="#3a6a3a", width=1, tags=("equipment", "sensor_rect"))))
+        items.append(("text", (LOOP_X + LOOP_W//2, LOOP_Y + LOOP_H//2), dict(text="LOOP\nSensor", fill="#8acc8a", font=self._font_bold_8, tags="equipment")))
         # Speaker — single orange box + simple icon
         sx, sy = SPEAKER_X, SPEAKER_Y
-        c.create_rectangle(sx, sy, sx + SPEAKER_W, sy + SPEAKER_H, fill="#b05820", outline="#8a4018", width=1, tags="equipment")
+        items.append(("rectangle", (sx, sy, sx + SPEAKER_W, sy + SPEAKER_H), dict(fill="#b05820", outline="#8a4018", width=1, tags="equipment")))
         icon_cx, icon_cy = sx + SPEAKER_W//2, sy + s(16)
-        c.create_oval(icon_cx - s(8), icon_cy - s(5), icon_cx + s(8), icon_cy + s(5), fill="#fff", outline="#aaa", width=1, tags="equipment")
-        c.create_text(sx + SPEAKER_W//2, sy + SPEAKER_H - s(8), text="SPEAKER", fill="#fff", font=("Segoe UI", s(7), "bold"), tags="equipment")
+        items.append(("oval", (icon_cx - s(8), icon_cy - s(5), icon_cx + s(8), icon_cy + s(5)), dict(fill="#fff", outline="#aaa", width=1, tags="equipment")))
+        items.append(("text", (sx + SPEAKER_W//2, sy + SPEAKER_H - s(8)), dict(text="SPEAKER", fill="#fff", font=self._font_bold_7, tags="equipment")))
         # Base Station — single green box (left of MENU so no overlap)
         bx, by = BASE_X, BASE_Y
-        c.create_rectangle(bx, by, bx + BASE_W, by + BASE_H, fill="#1a3a1a", outline="#3a6a3a", width=1, tags="equipment")
-        c.create_text(bx + BASE_W//2, by + BASE_H//2, text="BASE", fill="#7acc7a", font=("Segoe UI", s(8), "bold"), tags="equipment")
+        items.append(("rectangle", (bx, by, bx + BASE_W, by + BASE_H), dict(fill="#1a3a1a", outline="#3a6a3a", width=1, tags="equipment")))
+        items.append(("text", (bx + BASE_W//2, by + BASE_H//2), dict(text="BASE", fill="#7acc7a", font=self._font_bold_8, tags="equipment")))
         # Minimal connections: thin dashed lines, no labels
-        c.create_line(sx + SPEAKER_W, sy + SPEAKER_H//2, bx + BASE_W, by + BASE_H//2, fill=line_color, width=1, dash=(4, 4), tags="equipment")
-        c.create_line(bx + BASE_W//2, by, s(65), s(17), fill=line_color, width=1, dash=(4, 4), tags="equipment")
+        items.append(("line", (sx + SPEAKER_W, sy + SPEAKER_H//2, bx + BASE_W, by + BASE_H//2), dict(fill=line_color, width=1, dash=(4, 4), tags="equipment")))
+        items.append(("line", (bx + BASE_W//2, by, s(65), s(17)), dict(fill=line_color, width=1, dash=(4, 4), tags="equipment")))
         # Base → order screen (screen center: os_left + os_w//2, os_top + os_h//2)
         os_cx = s(242) + s(148)//2
         os_cy = s(112) + s(32)//2
-        c.create_line(bx + BASE_W, by + BASE_H//2, os_cx, os_cy, fill=line_color, width=1, dash=(4, 4), tags="equipment")
+        items.append(("line", (bx + BASE_W, by + BASE_H//2, os_cx, os_cy), dict(fill=line_color, width=1, dash=(4, 4), tags="equipment")))
+        self._batch_create(items)
 
     def _update_base_station(self):
+        """Reflect base station / loop state in the label and on the LOOP Sensor; no-op while the state is stable."""
+        state = (self.base_station_on, self.loop_triggered)
+        if state == self._last_base_state:
+            return
+        self._last_base_state = state
         if self.base_station_on:
             self.base_station_label.config(text="ON — reading menu", fg="#7fff7f")
         elif self.loop_triggered:
@@ -413,27 +536,59 @@ class DriveThruSimulation:
             pass
 
     def _update_order_display(self):
-        self.order_display.config(state="normal")
-        self.order_display.delete("1.0", "end")
+        """Bring the order display up to date, only touching the lines that changed since the last call."""
+        st = self._order_display_state
+        text = self.order_display
+        mutated = False
         if not self.order_items:
-            self.order_display.insert("1.0", "No order yet. When the menu is read out, you can read it here if you cannot hear.\n")
-            self._draw_order_screen_on_canvas("No order yet")
+            if st["mode"] != "empty":
+                text.config(state="normal")
+                mutated = True
+                text.delete("1.0", "end")
+                text.insert("1.0", "No order yet. When the menu is read out, you can read it here if you cannot hear.\n")
+                st.update(mode="empty", car_id=None, items_written=0, footer_written=False)
+                self._order_screen_lines = []
+                self._draw_order_screen_on_canvas("No order yet")
         else:
             car_id = f"Car #{self.car_number}" if self.car_number else "Order"
-            self.order_display.insert("1.0", f"ORDER CONFIRMED — {car_id}\n\n")
-            lines = []
-            for _, name in self.order_items:
-                self.order_display.insert("end", f"  • {name}\n")
-                # Short line for on-canvas screen (no price, truncate so it fits)
-                short = (name.split(" - ")[0].strip() if " - " in name else name)[:28]
-                if len(name) > 28:
-                    short = short.rstrip() + "…"
-                lines.append(short)
-            if self.order_confirmed:
-                self.order_display.insert("end", "\n[ Human preparing — drive to pick up to collect & pay ]\n")
-            canvas_text = f"ORDER CONFIRMED\n{car_id}\n" + "\n".join("• " + L for L in lines)
-            self._draw_order_screen_on_canvas(canvas_text)
-        self.order_display.config(state="disabled")
+            if st["mode"] != "order" or len(self.order_items) < st["items_written"]:
+                # Coming from the placeholder or the menu read-out: start a fresh order block
+                text.config(state="normal")
+                mutated = True
+                text.delete("1.0", "end")
+                text.insert("1.0", f"ORDER CONFIRMED — {car_id}\n\n")
+                text.mark_set("items_end", "end-1c")
+                st.update(mode="order", car_id=car_id, items_written=0, footer_written=False)
+                self._order_screen_lines = []
+            new_items = self.order_items[st["items_written"]:]
+            header_changed = car_id != st["car_id"]
+            footer_needed = self.order_confirmed and not st["footer_written"]
+            if new_items or header_changed or footer_needed:
+                if not mutated:
+                    text.config(state="normal")
+                    mutated = True
+                if header_changed:
+                    text.delete("1.0", "1.end")
+                    text.insert("1.0", f"ORDER CONFIRMED — {car_id}")
+                    st["car_id"] = car_id
+                for _, name in new_items:
+                    # "items_end" has right gravity, so it stays after the last item and before the footer
+                    text.insert("items_end", f"  • {name}\n")
+                    # Short line for on-canvas screen (no price, truncate so it fits)
+                    short = (name.split(" - ")[0].strip() if " - " in name else name)[:28]
+                    if len(name) > 28:
+                        short = short.rstrip() + "…"
+                    self._order_screen_lines.append(short)
+                st["items_written"] = len(self.order_items)
+                if footer_needed:
+                    items_end = text.index("items_end")
+                    text.insert(items_end, "\n[ Human preparing — drive to pick up to collect & pay ]\n")
+                    text.mark_set("items_end", items_end)
+                    st["footer_written"] = True
+                canvas_text = f"ORDER CONFIRMED\n{car_id}\n" + "\n".join("• " + L for L in self._order_screen_lines)
+                self._draw_order_screen_on_canvas(canvas_text)
+        if mutated:
+            text.config(state="disabled")
         # Update client response label
         if hasattr(self, "client_response_label"):
             self.client_response_label.config(text=self.client_response if self.client_response else "—")
@@ -449,49 +604,32 @@ class DriveThruSimulation:
         """Show the menu text below the drawing (say 1-5 to order, 0 repeat, 6 cancel)."""
         self.order_display.config(state="normal")
         self.order_display.delete("1.0", "end")
-        self.order_display.insert("1.0", "Reading out menu (read here if you can't hear):\n\n")
-        self.order_display.insert("end", "Welcome to KFC Westlands. This is our specials today.\n\n")
-        for i, name in enumerate(self.menu_items[:MENU_CHOICES], 1):
-            display_name = name.strip()
-            if display_name.lower().startswith("number ") and ": " in display_name:
-                display_name = display_name.split(": ", 1)[1]
-            self.order_display.insert("end", f"  {i}. {display_name}\n")
-        self.order_display.insert("end", "\nSay 1, 2, 3, 4, or 5 for your choice. Say 0 to hear the menu again. Say 6 to cancel your order.")
+        self.order_display.insert("1.0", self._menu_readout_text)
         self.order_display.config(state="disabled")
+        self._order_display_state["mode"] = "menu"
 
     def car_on_sensor(self):
         """Car moves onto sensor → loop triggers → base station → menu read out."""
         self.status.config(text="Car on sensor… loop triggered → base station ON → reading menu.")
-        self.root.update()
-        # Animate car to sensor
-        for step in range(1, 12):
-            self.car_progress = (step / 12) * POS_SENSOR
-            self._draw_car()
-            self.root.update()
-            time.sleep(0.04)
-        self.car_progress = POS_SENSOR
-        self.loop_triggered = True
-        self.base_station_on = True
-        self.menu_read = True
-        self._draw_car()
-        self._update_base_station()
-        self.status.config(text="Base station reading menu. Customer picks above, then click 'Drive to order'.")
+
+        def on_sensor():
+            self.loop_triggered = True
+            self.base_station_on = True
+            self.menu_read = True
+            self._update_base_station()
+            self.status.config(text="Base station reading menu. Customer picks above, then click 'Drive to order'.")
+
+        self._animate_car(POS_SENSOR, 12, 40, on_sensor)
 
     def drive_to_order(self):
         """Car drives to order window (after menu / picking)."""
         self.status.config(text="Car driving to order window…")
-        self.root.update()
-        start = self.car_progress
-        for step in range(1, 25):
-            t = step / 25
-            self.car_progress = start + (POS_ORDER - start) * t
-            self._draw_car()
-            self.root.update()
-            time.sleep(0.03)
-        self.car_progress = POS_ORDER
-        self._draw_car()
-        self._update_order_display()
-        self.status.config(text="At order window. Add items above. Order shows on screen. Then 'Drive to collection'.")
+
+        def at_order():
+            self._update_order_display()
+            self.status.config(text="At order window. Add items above. Order shows on screen. Then 'Drive to collection'.")
+
+        self._animate_car(POS_ORDER, 25, 30, at_order)
 
     def add_to_order(self, index: int):
         name = self.menu_items[index] if index < len(self.menu_items) else f"Item {index+1}"
@@ -505,20 +643,17 @@ class DriveThruSimulation:
     def drive_to_collection(self):
         """Car moves to pick-up window to collect order and pay."""
         self.status.config(text="Car moving to pick up — collect order and pay.")
-        self.root.update()
-        start = self.car_progress
-        for step in range(1, 30):
-            t = step / 30
-            self.car_progress = start + (POS_COLLECTION - start) * t
-            self._draw_car()
-            self.root.update()
-            time.sleep(0.03)
-        self.car_progress = POS_COLLECTION
-        self.car_at_collection = True
-        self._draw_car()
-        self.status.config(text="Car at pick up — customer collects order and pays.")
+
+        def at_collection():
+            self.car_at_collection = True
+            self.status.config(text="Car at pick up — customer collects order and pays.")
+
+        self._animate_car(POS_COLLECTION, 30, 30, at_collection)
 
     def reset(self):
+        self._cancel_scheduled()
+        self._flow_id += 1  # speech callbacks queued by the previous run become no-ops
+        self._clear_speech_queue()
         self.car_progress = -0.05
         self.loop_triggered = False
         self.base_station_on = False
@@ -7,13 +7,29 @@ and hands off to human operator for ordering.
 import time
 import threading
 import queue
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION, FIRST_COMPLETED
 from datetime import datetime
 from typing import List, Dict, Optional
 import json
 import os
+import re
 import subprocess
 import platform
 import shutil
+import hashlib
+import urllib.request
+import traceback
+import ctypes
+import ctypes.util
+import math
+import collections
+from functools import lru_cache, wraps
+
+try:
+    import winsound  # plays cached TTS audio on Windows
+except ImportError:
+    winsound = None
 
 # Detect platform
 IS_WINDOWS = platform.system() == "Windows"
@@ -45,12 +61,42 @@ try:
 except ImportError:
     print("⚠ Ollama not available. Install with: pip install ollama")
 
+# Persistent async HTTP client for Ollama generation (falls back to the ollama client per call)
+HTTPX_AVAILABLE = False
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    pass
+
+# Prefer faster-whisper (CTranslate2, int8 on CPU); the reference openai-whisper is the fallback
+FASTER_WHISPER_AVAILABLE = False
 try:
-    import whisper
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
     WHISPER_AVAILABLE = True
-    print("✓ Whisper available")
+    print("✓ Whisper available (faster-whisper)")
+except ImportError:
+    try:
+        import whisper
+        WHISPER_AVAILABLE = True
+        print("✓ Whisper available")
+    except ImportError:
+        print("⚠ Whisper not available. Install with: pip install faster-whisper")
+
+# Optional streaming recognition: Vosk decodes while the customer is still speaking, webrtcvad gates silence
+VOSK_AVAILABLE = False
+WEBRTCVAD_AVAILABLE = False
+try:
+    import vosk
+    VOSK_AVAILABLE = True
+except ImportError:
+    pass
+try:
+    import webrtcvad
+    WEBRTCVAD_AVAILABLE = True
 except ImportError:
-    print("⚠ Whisper not available. Install with: pip install openai-whisper")
+    pass
 
 # Determine TTS engine based on platform
 TTS_ENGINE = None
@@ -90,18 +136,207 @@ else:
         print("Warning: pyttsx3 not available. TTS will be disabled.")
         TTS_ENGINE = None
 
+# Engine modules the methods use (fallbacks, re-initialisation), bound once here instead of imported per call;
+# None when not installed
+try:
+    import win32com.client
+except ImportError:
+    win32com = None
+try:
+    import pyttsx3
+except ImportError:
+    pyttsx3 = None
+try:
+    import numpy as np  # installed with either Whisper package
+except ImportError:
+    np = None
+
+
+def _co_initialize():
+    """Voice thread initializer: SAPI is COM, so the thread that creates and uses it needs an apartment."""
+    try:
+        import pythoncom
+        pythoncom.CoInitialize()
+    except ImportError:
+        pass
+
+
+def _on_voice_thread(method):
+    """Run a DriveThruSystem method on its voice thread (waiting for the result) when called from any other
+    thread, so SAPI/pyttsx3 objects are only ever used from the COM apartment that created them."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if threading.get_ident() == self._voice_thread_id:
+            return method(self, *args, **kwargs)
+        return self._voice_pool.submit(method, self, *args, **kwargs).result()
+    return wrapper
+
+
+# Fixed prompts of the menu announcement (also pre-rendered into the TTS cache)
+MENU_GREETING = "Welcome to KFC drive thru. These are the specials of the day."
+MENU_PROMPT = "Say 1, 2, 3, or 4 for your choice. Say 0 to hear the menu again. Say 6 to cancel your order. I am listening now."
+# Fixed replies of the menu-choice flow
+MENU_REPEAT = "Repeating the menu."
+ORDER_CANCELLED = "Order cancelled."
+CHOICE_REPROMPT = "Say 1, 2, 3, 4, or 5 to order. Say 0 to repeat the menu. Say 6 to cancel. I am listening now."
+CHOICE_RETRY = "Say 1, 2, 3, 4, or 5 for your choice. Say 0 to hear the menu again. Say 6 to cancel. I am listening now."
+PICKUP_PROMPT = "Please drive to the pick-up window. Our team will help you there."
+# The only text (with the menu items) kept in the TTS disk cache: anything else, e.g. read-backs of what the
+# customer said or car numbers, is spoken live and never written to disk
+CACHED_PHRASES = (MENU_GREETING, MENU_PROMPT, MENU_REPEAT, ORDER_CANCELLED, CHOICE_REPROMPT, CHOICE_RETRY,
+                  PICKUP_PROMPT)
+
+# Pronunciation substitutions for TTS, applied in one regex pass
+_SPEECH_SUBS = {"$": " dollars ", " - ": ". ", ": ": ". "}
+_SPEECH_RE = re.compile(r"\$| - |: ")
+
+
+@lru_cache(maxsize=256)
+def _clean_cached(text: str) -> str:
+    """Cleaned TTS text; cached because menu phrases repeat for every car."""
+    text = _SPEECH_RE.sub(lambda m: _SPEECH_SUBS[m.group(0)], text)
+    # Clean up multiple spaces
+    return " ".join(text.split())
+
+
+# Spoken numbers (0 = repeat, 1-5 = menu, 6 = cancel, car numbers); digits past ten are said as digits
+_NUM_WORDS = {
+    0: "zero",
+    1: "one", 2: "two", 3: "three", 4: "four",
+    5: "five", 6: "six", 7: "seven", 8: "eight",
+    9: "nine", 10: "ten"
+}
+
+# A menu offer prepared once at start-up: spoken form, TTS-cleaned text and its cached WAV (None until rendered)
+MenuItem = collections.namedtuple("MenuItem", "raw spoken cleaned wav_path")
+
+# Order-taking phrase detectors: continuous capture finished, yes / no to a read-back, nothing to add
+# (whole words only, one regex pass each)
+_ORDER_DONE_RE = re.compile(r"\b(?:done|that's all|that's it|finished|that will be all|complete)\b")
+_ORDER_WRONG_RE = re.compile(r"\b(?:no|wrong|change|not quite)\b")
+_ORDER_YES_RE = re.compile(r"\b(?:yes|correct|right|that's it|that's all)\b")
+_NOTHING_MORE_RE = re.compile(r"\b(?:no|that's all|nothing|no thanks|that's it)\b")
+
+# Short drive-through phrases: single greedy pass, no conditioning on earlier text (avoids looping output)
+WHISPER_GREEDY_OPTIONS = {
+    "temperature": 0.0,
+    "condition_on_previous_text": False,
+    "no_speech_threshold": 0.6,
+    "compression_ratio_threshold": 2.4,
+}
+# An order reformat is a line or two; cap it so a rambling generation can't stall the lane
+OLLAMA_GENERATE_OPTIONS = {"num_predict": 128, "temperature": 0.0}
+# Stock phrases Whisper hallucinates on silence/noise (subtitle boilerplate from its training data)
+_WHISPER_BOILERPLATE_RE = re.compile(
+    r"\b(?:thanks? (?:you )?for watching|please subscribe[^.!?]*|subtitles? by (?:the )?(?:amara\.org)?[^.!?]*|"
+    r"transcribed by[^.!?]*|amara\.org[^.!?]*)[.!?]*", re.I)
+
+
+def _clean_whisper_text(text: str) -> str:
+    """Strip Whisper boilerplate and collapse loops (a 1-4 word run repeated 3+ times in a row is kept once)."""
+    words = _WHISPER_BOILERPLATE_RE.sub(" ", text).split()
+    for n in range(1, 5):
+        keys = [w.strip(".,!?").lower() for w in words]
+        out = []
+        i = 0
+        while i < len(words):
+            reps = 1
+            while keys[i:i + n] == keys[i + reps * n:i + (reps + 1) * n]:
+                reps += 1
+            if reps >= 3 and i + n <= len(words):
+                out.extend(words[i + (reps - 1) * n:i + reps * n])  # the last copy keeps any end punctuation
+                i += reps * n
+            else:
+                out.append(words[i])
+                i += 1
+        words = out
+    return " ".join(words)
+
+
+# Vosk grammar for menu choices: only these words (or "[unk]" for anything else) can be decoded
+MENU_CHOICE_GRAMMAR = json.dumps(["zero", "one", "two", "three", "four", "five", "six", "repeat", "[unk]"])
+
+# Engines that can render speech to a WAV file for the TTS cache
+CACHEABLE_TTS_METHODS = ("win32com_sapi", "espeak", "pyttsx3")
+
+SVSF_ASYNC = 1  # SAPI SpeechVoiceSpeakFlags.SVSFlagsAsync: Speak queues the text and returns
+SVSF_PURGE = 2  # SVSFPurgeBeforeSpeak: drop whatever is still queued
+
+_SENT_SPLIT = re.compile(r"(?<=[.!?])\s+")
+
+
+def _sentence_chunks(text: str, max_length: int):
+    """Yield whole sentences grouped into chunks of at most max_length characters (a longer sentence goes alone)."""
+    chunk_parts = []
+    chunk_len = 0
+    for sentence in _SENT_SPLIT.split(text):
+        if chunk_parts and chunk_len + 1 + len(sentence) > max_length:
+            yield " ".join(chunk_parts)
+            chunk_parts = []
+            chunk_len = 0
+        chunk_len += len(sentence) + (1 if chunk_parts else 0)
+        chunk_parts.append(sentence)
+    if chunk_parts:
+        yield " ".join(chunk_parts)
+
+
+_config_files: Dict[str, tuple] = {}  # path -> ((mtime_ns, size), parsed JSON)
+
+
+def _read_config_file(path: str) -> Dict:
+    """Parsed JSON of a config file, re-read only when its mtime or size changes. Treat the result as read-only."""
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _config_files.get(path)
+    if cached is None or cached[0] != stamp:
+        with open(path, 'r') as f:
+            cached = (stamp, json.load(f))
+        _config_files[path] = cached
+    return cached[1]
+
 
 class DriveThruSystem:
     """Main drive-through ordering system"""
     
+    # speak() backend per tts_method; the bound method is looked up once, when tts_method is set
+    _TTS_BACKENDS = {
+        "win32com_sapi": "_speak_sapi",
+        "pyttsx3": "_speak_pyttsx3",
+        "espeak": "_speak_espeak",
+    }
+    
     def __init__(self, config_file: str = "config.json"):
         """Initialize the drive-through system"""
+        self.tts_method = None
+        self._config_file = config_file
         self.config = self._load_config(config_file)
         self.running = False
+        # Set once run() shuts down: speech, listening and the order flow stop at their next step
+        self._cancel = threading.Event()
         self.current_customer = None
-        self.order_queue = queue.Queue()
+        # Operator handoffs, FIFO: one producer (the voice thread) and one consumer (see next_order)
+        self.order_queue = collections.deque()
+        self._order_event = threading.Event()
+        # Operator notifications for the POS endpoint ("pos_endpoint"), sent in batches by _notify_drainer
+        self._pos_endpoint = self.config.get("pos_endpoint")
+        self._notify_buffer: List[Dict] = []
+        self._notify_lock = threading.Lock()
+        self._notify_wake = threading.Event()
+        if self._pos_endpoint:
+            threading.Thread(target=self._notify_drainer, name="pos-notify", daemon=True).start()
         self._car_number = 0  # for "Car number one", etc.
         self.use_raspberry_pi = self.config.get("use_raspberry_pi", False)
+        # Car arrivals from the loop detector's edge interrupt (kept apart from order_queue, which holds handoffs).
+        # An asyncio.Queue created by run(); the GPIO thread feeds it via call_soon_threadsafe.
+        self.car_events = None
+        self._loop = None
+        self._edge_detect = False
+        # Recent arrival times; their mean gap shapes the polling schedule when there is no edge interrupt
+        self._arrivals = collections.deque(maxlen=500)
+        self._poll_schedule = [self.config.get("poll_interval_min", 0.2)]
+        # All blocking speech/recognition runs on this one thread, so SAPI objects stay on a single COM thread
+        self._voice_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="voice", initializer=_co_initialize)
+        self._voice_thread_id = self._voice_pool.submit(threading.get_ident).result()  # see _on_voice_thread
         
         # Initialize Raspberry Pi GPIO if available
         if self.use_raspberry_pi and GPIO_AVAILABLE:
@@ -109,6 +344,13 @@ class DriveThruSystem:
             GPIO.setmode(GPIO.BCM)
             GPIO.setup(self.loop_pin, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
             print(f"Raspberry Pi GPIO initialized. Loop detector on pin {self.loop_pin}")
+            try:
+                GPIO.add_event_detect(self.loop_pin, GPIO.RISING, callback=self._on_car_detected,
+                                      bouncetime=self.config.get("debounce_ms", 300))
+                self._edge_detect = True
+                print("  Loop detector: edge-triggered (no polling)")
+            except RuntimeError as e:
+                print(f"  ⚠ Edge detection unavailable ({e}), polling loop detector instead")
         else:
             print("Running in simulation mode (no GPIO)")
         
@@ -120,39 +362,44 @@ class DriveThruSystem:
             print(f"⚠ No microphone found: {e}")
             print("   Voice input disabled. Connect a mic or set default in Windows Sound settings.")
             self.microphone = None
+        # Held for every capture: a continuous-order producer still finishing its last listen releases it
+        # before the next listen opens the mic (re-entrant: _capture_phrases holds it around _listen_streaming)
+        self._mic_lock = threading.RLock()
+        
+        # Streaming recognizer (Vosk) is loaded on the first listen (see _ensure_vosk)
+        self.use_vosk = self.config.get("use_vosk_streaming", False) and VOSK_AVAILABLE
+        # Menu choices (0-6) via Vosk restricted to the choice words, instead of Whisper (see listen_menu_choice)
+        self.use_vosk_kws = self.config.get("use_vosk_menu_choice", False) and VOSK_AVAILABLE
+        self._vosk_model = None
+        self._vad = None
+        self._pyaudio = None
         
-        # Initialize Whisper model if enabled
+        # Whisper model is loaded on the first transcription (see _ensure_whisper)
         self.use_whisper = self.config.get("use_ollama_whisper", False) and WHISPER_AVAILABLE
         self.whisper_model = None
-        if self.use_whisper:
-            self._setup_whisper()
+        self._whisper_warm = False
+        # Whisper and Google race here when the Google fallback is enabled (see _recognize_race)
+        self._stt_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="stt")
+        self._transcripts = collections.OrderedDict()  # audio digest -> transcript (LRU, see _transcribe_audio)
         
         # Initialize Ollama client if enabled
         self.use_ollama = self.config.get("use_ollama_for_processing", False) and OLLAMA_AVAILABLE
         self.ollama_client = None
-        if self.use_ollama:
-            self._setup_ollama()
-        
-        # Initialize TTS based on available engine
-        self._setup_tts()
-        
-        # Calibrate microphone if available
-        if self.microphone is not None:
-            print("Calibrating microphone for ambient noise...")
-            with self.microphone as source:
-                self.recognizer.adjust_for_ambient_noise(source, duration=1)
-            self.recognizer.energy_threshold = 300  # Lower = more sensitive
-            print("✓ Microphone calibrated!")
-            print(f"  Energy threshold: {self.recognizer.energy_threshold} (lower = more sensitive)")
-            if self.use_whisper:
-                print(f"  Using Whisper for speech recognition (model: {self.config.get('whisper_model', 'base')})")
-            else:
-                print("  Using Google Speech Recognition")
-        else:
-            print("  Voice input: disabled (no microphone)")
+        self._ollama_http = None
         
         # KFC special offers
         self.special_offers = self.config.get("special_offers", [])
+        self._menu = [self._preprocess_offer(o) for o in self.special_offers]
+        # Cleaned texts _speak_cached may store on disk (fixed phrases and the announced menu items only)
+        self._cacheable_texts = frozenset([self._clean_text_for_speech(p) for p in CACHED_PHRASES] +
+                                          [item.cleaned for item in self._menu[:4]])
+        # "2" / "two" -> 2 for every offer, matched as whole words in one pass (see _find_menu_number)
+        self._word_to_num = {}
+        for i in range(1, len(self.special_offers) + 1):
+            self._word_to_num[str(i)] = i
+            self._word_to_num[_NUM_WORDS.get(i, str(i))] = i
+        alternatives = "|".join(sorted(map(re.escape, self._word_to_num), key=len, reverse=True))
+        self._menu_num_re = re.compile(r"\b(" + alternatives + r")\b", re.I) if self._word_to_num else None
         
         # Debug: Print loaded menu items
         if len(self.special_offers) > 0:
@@ -163,25 +410,233 @@ class DriveThruSystem:
             print("\n⚠ WARNING: No menu items loaded from config.json!")
             print("Please check that config.json contains 'special_offers' array.")
         
-    def _setup_whisper(self):
-        """Initialize Whisper model for better speech recognition"""
+        # Independent start-up work runs concurrently: TTS set-up (and the menu audio pre-render) on the
+        # voice thread, so SAPI is created in the COM apartment that later speaks; Ollama's connection check
+        # and the 1 s microphone calibration on short-lived init threads
+        self._libespeak = None  # in-process espeak (ctypes), set up by _setup_tts on Linux
+        self._tts_cache_dir = None
+        self._wav_memory = collections.OrderedDict()  # cache path -> WAV bytes (see _wav_bytes)
+        pending = [self._voice_pool.submit(self._setup_voice_output)]
+        init_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="init")
+        pending.append(init_pool.submit(self._calibrate_microphone))
+        if self.use_ollama:
+            pending.append(init_pool.submit(self._setup_ollama))
+        init_pool.shutdown(wait=False)
+        done, _ = wait(pending, return_when=FIRST_EXCEPTION)
+        for future in done:
+            future.result()
+    
+    def _setup_voice_output(self):
+        """TTS engine, audio cache and cached menu phrases (runs on the voice thread)."""
+        self._setup_tts()
+        self._tts_cache_dir = self._setup_tts_cache()
+        if self.config.get("tts_check_on_start", False):
+            self._check_live_tts()
+        # Render the fixed menu phrases once so every car hears cached audio
+        self._prewarm_tts_cache()
+    
+    def _check_live_tts(self):
+        """Speak a short phrase through the live engine path (TTS cache bypassed), to confirm it is audible."""
+        cache_dir, self._tts_cache_dir = self._tts_cache_dir, None
+        try:
+            print("Checking live speech output (tts_check_on_start)...")
+            self._speak_impl(self._clean_text_for_speech("Voice check. If you can hear this, speech output works."))
+        finally:
+            self._tts_cache_dir = cache_dir
+    
+    def _calibrate_microphone(self):
+        """
+        Set the microphone energy threshold. Uses the calibration saved in config.json when there is one;
+        otherwise (or with "recalibrate_microphone": true) samples 1 s of ambient noise and folds it into
+        the saved long-term average, so one noisy boot (a car idling nearby) can't skew it.
+        """
+        self._energy_threshold = 300  # Lower = more sensitive
+        if self.microphone is not None:
+            learned = self.config.get("energy_threshold_ema")
+            if learned and not self.config.get("recalibrate_microphone", False):
+                print("Using saved microphone calibration")
+            else:
+                print("Calibrating microphone for ambient noise...")
+                with self._mic_lock, self.microphone as source:
+                    self.recognizer.adjust_for_ambient_noise(source, duration=1)
+                measured = self.recognizer.energy_threshold
+                learned = measured if not learned else 0.9 * learned + 0.1 * measured
+                self._save_config_value("energy_threshold_ema", round(learned, 1))
+                print("✓ Microphone calibrated!")
+            self._energy_threshold = learned
+            self.recognizer.energy_threshold = learned
+            # Keep adapting to the lane's noise while listening, without another blocking calibration
+            self.recognizer.dynamic_energy_threshold = True
+            print(f"  Energy threshold: {self.recognizer.energy_threshold:.0f} (lower = more sensitive)")
+            if self.use_whisper:
+                print(f"  Using Whisper for speech recognition (model: {self.config.get('whisper_model', 'tiny.en')}, loads on first use)")
+            else:
+                print("  Using Google Speech Recognition")
+        else:
+            print("  Voice input: disabled (no microphone)")
+        
+    def _ensure_whisper(self):
+        """Load the Whisper model on first use; returns None (and disables Whisper) if it can't be loaded."""
+        if self.whisper_model is not None or not self.use_whisper:
+            return self.whisper_model
+        model_name = self.config.get("whisper_model", "tiny.en")
         try:
-            import whisper
-            model_name = self.config.get("whisper_model", "base")
             print(f"Loading Whisper model: {model_name}...")
             print("  (This may take a moment on first run)")
-            self.whisper_model = whisper.load_model(model_name)
+            if FASTER_WHISPER_AVAILABLE:
+                # Prefer the int8 copy converted at install time (install_raspberry_pi.sh) over downloading
+                local = os.path.join("models", f"whisper-{model_name}-int8")
+                self.whisper_model = WhisperModel(
+                    local if os.path.isdir(local) else model_name,
+                    device="cpu",
+                    compute_type=self.config.get("whisper_compute_type", "int8"),
+                    cpu_threads=self.config.get("whisper_cpu_threads", 4),
+                    num_workers=1,
+                )
+            else:
+                self.whisper_model = whisper.load_model(model_name)
             print(f"✓ Whisper model '{model_name}' loaded successfully")
         except Exception as e:
             print(f"⚠ Failed to load Whisper model: {e}")
             print("  Falling back to Google Speech Recognition")
             self.use_whisper = False
             self.whisper_model = None
+        return self.whisper_model
+    
+    def _warm_whisper(self):
+        """Load Whisper and run one silent second through it, so the first customer doesn't pay load/compile time."""
+        model = self._ensure_whisper()
+        if model is None or self._whisper_warm:
+            return
+        try:
+            silence = np.zeros(16000, dtype=np.float32)
+            if FASTER_WHISPER_AVAILABLE:
+                segments, _ = model.transcribe(silence, language="en", beam_size=1)
+                list(segments)  # segments are decoded lazily
+            else:
+                model.transcribe(silence, language="en", fp16=False)
+            self._whisper_warm = True
+            print("✓ Whisper warmed up")
+        except Exception as e:
+            print(f"⚠ Whisper warm-up failed: {e}")
+    
+    def _transcribe_whisper(self, audio) -> Optional[str]:
+        """Transcribe a speech_recognition AudioData with Whisper; None if Whisper is not usable."""
+        model = self._ensure_whisper()
+        if model is None:
+            return None
+        # Whisper takes 16 kHz mono float32 samples directly; no WAV encode/decode round trip per phrase
+        pcm = audio.get_raw_data(convert_rate=16000, convert_width=2)
+        if not FASTER_WHISPER_AVAILABLE:
+            # openai-whisper has no VAD of its own and its cost scales with the audio length
+            pcm = self._trim_speech(pcm)
+            if pcm is None:
+                raise sr.UnknownValueError()  # nothing but silence/road noise: skip the model entirely
+        samples = np.frombuffer(pcm, dtype="<i2").astype(np.float32)
+        samples *= 1.0 / 32768.0  # scale in place: one cast and one multiply, no second temporary array
+        
+        if FASTER_WHISPER_AVAILABLE:
+            # vad_filter runs Silero and decodes only the speech regions (no speech: nothing to decode)
+            segments, _ = model.transcribe(samples, language="en", vad_filter=True, beam_size=1, best_of=1,
+                                           **WHISPER_GREEDY_OPTIONS)
+            text = "".join(segment.text for segment in segments)
+        else:
+            # beam_size unset + temperature 0 is openai-whisper's greedy decoder
+            text = model.transcribe(samples, language="en", fp16=False, **WHISPER_GREEDY_OPTIONS)["text"]
+        text = _clean_whisper_text(text)
+        if not text.strip():
+            raise sr.UnknownValueError()  # only silence or boilerplate: same as any recognizer hearing nothing
+        return text
+    
+    def _trim_speech(self, pcm: bytes) -> Optional[bytes]:
+        """Keep only the voiced parts of 16 kHz mono int16 audio (webrtcvad, 30 ms frames, 300 ms padding around
+        speech); None if nothing is voiced. Returned unchanged when webrtcvad isn't installed."""
+        if not WEBRTCVAD_AVAILABLE:
+            return pcm
+        vad = webrtcvad.Vad(self.config.get("vad_aggressiveness", 3))
+        frame, pad = 960, 10  # bytes per 30 ms frame; frames of context kept either side of speech
+        frames = [pcm[i:i + frame] for i in range(0, len(pcm) - frame + 1, frame)]
+        voiced = [vad.is_speech(f, 16000) for f in frames]
+        if not any(voiced):
+            return None
+        keep = [any(voiced[max(0, i - pad):i + pad + 1]) for i in range(len(frames))]
+        return b"".join(f for f, k in zip(frames, keep) if k)
+    
+    def _ensure_vosk(self, for_keywords: bool = False):
+        """Load the Vosk model (and VAD) on first use; returns None if that use (streaming or menu keywords) is off
+        or Vosk can't be used."""
+        if not (self.use_vosk_kws if for_keywords else self.use_vosk):
+            return None
+        if self._vosk_model is not None:
+            return self._vosk_model
+        path = self.config.get("vosk_model_path", "models/vosk-model-small-en-us-0.15")
+        try:
+            vosk.SetLogLevel(-1)
+            self._vosk_model = vosk.Model(path)
+            print(f"✓ Vosk streaming model loaded: {path}")
+            if WEBRTCVAD_AVAILABLE:
+                self._vad = webrtcvad.Vad(self.config.get("vad_aggressiveness", 3))
+        except Exception as e:
+            print(f"⚠ Failed to load Vosk model '{path}': {e}")
+            print("  Falling back to batch listening")
+            self.use_vosk = self.use_vosk_kws = False
+            self._vosk_model = None
+        return self._vosk_model
+    
+    def _listen_streaming(self, timeout: float, phrase_time_limit: float, grammar: Optional[str] = None) -> Optional[str]:
+        """Recognize one utterance while it is spoken: 30 ms mic frames go straight into Vosk, which finalizes at
+        the end-of-speech silence. grammar (a JSON word list) restricts what Vosk can decode. Raises
+        sr.WaitTimeoutError / sr.UnknownValueError like the batch path; returns None (and disables streaming)
+        if the audio stream itself fails."""
+        with self._mic_lock:
+            rate, frame = 16000, 480  # 16 kHz mono int16; 30 ms is a frame size webrtcvad accepts
+            pyaudio = sr.Microphone.get_pyaudio()
+            try:
+                if self._pyaudio is None:
+                    self._pyaudio = pyaudio.PyAudio()
+                stream = self._pyaudio.open(format=pyaudio.paInt16, channels=1, rate=rate, input=True,
+                                            frames_per_buffer=frame, input_device_index=self.microphone.device_index)
+            except Exception as e:
+                print(f"⚠ Streaming recognition unavailable ({e}), using batch listening")
+                self.use_vosk = self.use_vosk_kws = False
+                return None
+            if grammar:
+                rec = vosk.KaldiRecognizer(self._vosk_model, rate, grammar)
+            else:
+                rec = vosk.KaldiRecognizer(self._vosk_model, rate)
+            vad = self._vad
+            start = time.time()
+            speech_start = None
+            try:
+                while True:
+                    data = stream.read(frame, exception_on_overflow=False)
+                    now = time.time()
+                    if vad is not None and speech_start is None and not vad.is_speech(data, rate):
+                        # Leading silence never reaches the recognizer
+                        if now - start > timeout:
+                            raise sr.WaitTimeoutError("listening timed out while waiting for phrase to start")
+                        continue
+                    if rec.AcceptWaveform(data):
+                        text = json.loads(rec.Result()).get("text", "")
+                        if text:
+                            return text
+                        speech_start = None  # the "speech" was noise; keep waiting
+                    elif speech_start is None and (vad is not None or json.loads(rec.PartialResult()).get("partial")):
+                        speech_start = now
+                    if speech_start is None and now - start > timeout:
+                        raise sr.WaitTimeoutError("listening timed out while waiting for phrase to start")
+                    if speech_start is not None and now - speech_start > phrase_time_limit:
+                        text = json.loads(rec.FinalResult()).get("text", "")
+                        if text:
+                            return text
+                        raise sr.UnknownValueError()
+            finally:
+                stream.stop_stream()
+                stream.close()
     
     def _setup_ollama(self):
         """Initialize Ollama client for order processing"""
         try:
-            import ollama
             base_url = self.config.get("ollama_base_url", "http://localhost:11434")
             model_name = self.config.get("ollama_model", "llama2")
             
@@ -201,55 +656,86 @@ class DriveThruSystem:
                 if models and 'models' in models:
                     available = [m.get('name', 'unknown') for m in models['models']]
                     print(f"  Available models: {', '.join(available)}")
+                # Load the model now and keep it resident, so the first customer doesn't pay for the load
+                self.ollama_client.generate(model=model_name, prompt="",
+                                            keep_alive=self.config.get("ollama_keep_alive", "1h"))
+                print(f"✓ Ollama model loaded: {model_name}")
+                if HTTPX_AVAILABLE:
+                    # One pooled keep-alive connection for the whole shift instead of a new one per order
+                    self._ollama_http = httpx.AsyncClient(base_url=base_url, timeout=httpx.Timeout(60, connect=2))
             except Exception as e:
                 print(f"⚠ Ollama connection failed: {e}")
                 print("  Make sure Ollama is running: ollama serve")
                 print("  Or install Ollama: https://ollama.ai")
                 self.use_ollama = False
                 self.ollama_client = None
-        except ImportError:
-            print("⚠ Ollama not installed. Install with: pip install ollama")
-            self.use_ollama = False
-            self.ollama_client = None
         except Exception as e:
             print(f"⚠ Failed to initialize Ollama: {e}")
             self.use_ollama = False
             self.ollama_client = None
     
-    def _load_config(self, config_file: str) -> Dict:
-        """Load configuration from JSON file"""
+    @staticmethod
+    def _load_config(config_file: str) -> Dict:
+        """Load configuration from JSON file (no system needed: test.py checks the menu with it before start-up)"""
         default_config = {
             "special_offers": [],
             "loop_detector_pin": 18,
             "detection_interval": 3.0,
+            "poll_interval_min": 0.2,
             "voice_timeout": 8.0,
+            "menu_item_pause": 0.5,
             "operator_notification": True,
+            "pos_endpoint": None,
+            "pos_retry_max_s": 60.0,
+            "pos_buffer_max": 500,
+            "pos_spill_file": "pos_unsent.jsonl",
             "use_raspberry_pi": True,
             "use_ollama_whisper": False,
-            "whisper_model": "base",
+            "use_vosk_streaming": False,
+            "use_vosk_menu_choice": False,
+            "vosk_model_path": "models/vosk-model-small-en-us-0.15",
+            "vad_aggressiveness": 3,
+            "whisper_model": "tiny.en",
+            "whisper_compute_type": "int8",
+            "whisper_cpu_threads": 4,
+            "google_stt_fallback": False,
+            "stt_timeout": 10.0,
             "use_ollama_for_processing": False,
             "ollama_base_url": "http://localhost:11434",
-            "ollama_model": "llama2"
+            "ollama_model": "llama2",
+            "ollama_keep_alive": "1h",
+            "debounce_ms": 300,
+            "tts_cache": True,
+            "tts_check_on_start": False,
+            "tts_cache_dir": "tts_cache"
         }
         
         if os.path.exists(config_file):
             try:
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-                    default_config.update(config)
+                default_config.update(_read_config_file(config_file))
             except Exception as e:
                 print(f"Error loading config: {e}. Using defaults.")
         
         return default_config
     
+    def _save_config_value(self, key: str, value):
+        """Write one key back to the config file, leaving everything else in it as it was."""
+        try:
+            config = {}
+            if os.path.exists(self._config_file):
+                config = dict(_read_config_file(self._config_file))
+            config[key] = value
+            with open(self._config_file, 'w') as f:
+                json.dump(config, f, indent=2)
+            self.config[key] = value
+        except Exception as e:
+            print(f"⚠ Could not save {key} to {self._config_file}: {e}")
+    
     def _setup_tts(self):
         """Configure text-to-speech engine"""
-        global TTS_ENGINE
-        
         if TTS_ENGINE == "win32com_sapi":
             # Windows SAPI via win32com - most reliable on Windows
             try:
-                import win32com.client
                 self.sapi_speaker = win32com.client.Dispatch("SAPI.SpVoice")
                 # Set volume to max (0-100) so voice is audible
                 try:
@@ -257,8 +743,20 @@ class DriveThruSystem:
                 except Exception:
                     pass
                 
-                # Set voice to female/Kenyan if available
+                # Set voice to female/Kenyan if available.
+                # Read each voice's metadata over COM once; all matching/scoring below is plain Python.
                 voices = self.sapi_speaker.GetVoices()
+                voice_meta = []
+                for i in range(voices.Count):
+                    voice = voices.Item(i)
+                    voice_meta.append({
+                        "obj": voice,
+                        "name": voice.GetDescription(),
+                        "lang": voice.GetAttribute("Language") or "",
+                        "gender": voice.GetAttribute("Gender"),
+                    })
+                # Lower-cased name -> metadata, so configured names are a dict lookup
+                self._voice_by_name = {meta["name"].lower(): meta for meta in voice_meta}
                 voice_set = False
                 
                 # Get voice preferences from config
@@ -268,106 +766,89 @@ class DriveThruSystem:
                 
                 # If specific voice name is provided, use it
                 if specific_voice_name:
-                    for i in range(voices.Count):
-                        voice = voices.Item(i)
-                        voice_name = voice.GetDescription()
-                        if specific_voice_name.lower() in voice_name.lower():
-                            self.sapi_speaker.Voice = voice
-                            print(f"  Selected configured voice: {voice_name}")
-                            voice_set = True
-                            break
+                    meta = self._find_voice(specific_voice_name)
+                    if meta:
+                        self.sapi_speaker.Voice = meta["obj"]
+                        print(f"  Selected configured voice: {meta['name']}")
+                        voice_set = True
                 
                 # Otherwise, try to find female voice (preferably Kenyan/African)
                 if not voice_set:
-                    best_voice = None
+                    best_meta = None
                     best_score = 0
                     
-                    for i in range(voices.Count):
-                        voice = voices.Item(i)
-                        voice_name = voice.GetDescription()
-                        voice_id = voice.Id
-                        gender = voice.GetAttribute("Gender")
-                        language = voice.GetAttribute("Language")
+                    for meta in voice_meta:
+                        voice_name = meta["name"].lower()
+                        language = meta["lang"].lower()
                         
                         score = 0
                         
                         # Prefer female voices
-                        if "female" in voice_name.lower() or "woman" in voice_name.lower() or gender == "Female":
+                        if "female" in voice_name or "woman" in voice_name or meta["gender"] == "Female":
                             score += 10
                         
                         # Prefer Kenyan/African language codes
-                        if lang_pref in language.lower():
+                        if lang_pref in language:
                             score += 20
-                        elif "ke" in language.lower() or "kenya" in language.lower():
+                        elif "ke" in language or "kenya" in language:
                             score += 15
-                        elif "africa" in voice_name.lower() or "african" in language.lower():
+                        elif "africa" in voice_name or "african" in language:
                             score += 10
                         
                         # Prefer voices with "Zira" or common female names
-                        if "zira" in voice_name.lower():
+                        if "zira" in voice_name:
                             score += 5
                         
                         if score > best_score:
                             best_score = score
-                            best_voice = voice
+                            best_meta = meta
                     
-                    if best_voice:
-                        self.sapi_speaker.Voice = best_voice
-                        voice_name = best_voice.GetDescription()
-                        language = best_voice.GetAttribute("Language")
-                        print(f"  Selected voice: {voice_name}")
-                        print(f"  Language: {language}")
+                    if best_meta:
+                        self.sapi_speaker.Voice = best_meta["obj"]
+                        print(f"  Selected voice: {best_meta['name']}")
+                        print(f"  Language: {best_meta['lang']}")
                         voice_set = True
                 
                 # If still no voice set, use default
                 if not voice_set:
                     print("  Using default voice")
                 
+                # Voice token per speaker role; both roles share the one SpVoice, which switches
+                # Voice only when the role changes (see _sapi_speak_with_retry)
+                self._sapi_voices = {"sapi_speaker": self.sapi_speaker.Voice}
+                self._sapi_active_role = "sapi_speaker"
+                
                 # Second voice for order read-back (different from menu voice)
                 self.sapi_speaker_order = None
                 order_voice_name = self.config.get("order_voice_name")
-                if order_voice_name and voices.Count > 1:
-                    for i in range(voices.Count):
-                        voice = voices.Item(i)
-                        vname = voice.GetDescription()
-                        # Prefer male/different voice for order (David, Mark, etc.)
-                        if order_voice_name.lower() in vname.lower():
-                            self.sapi_speaker_order = win32com.client.Dispatch("SAPI.SpVoice")
-                            self.sapi_speaker_order.Voice = voice
-                            try:
-                                self.sapi_speaker_order.Volume = 100
-                            except Exception:
-                                pass
-                            print(f"  Order voice: {vname}")
-                            break
-                    if self.sapi_speaker_order is None:
+                if order_voice_name and len(voice_meta) > 1:
+                    # Prefer male/different voice for order (David, Mark, etc.)
+                    order_meta = self._find_voice(order_voice_name)
+                    if order_meta is None:
                         # Use first male voice if order_voice not found
-                        for i in range(voices.Count):
-                            voice = voices.Item(i)
-                            if "male" in voice.GetDescription().lower() or "david" in voice.GetDescription().lower():
-                                self.sapi_speaker_order = win32com.client.Dispatch("SAPI.SpVoice")
-                                self.sapi_speaker_order.Voice = voice
-                                try:
-                                    self.sapi_speaker_order.Volume = 100
-                                except Exception:
-                                    pass
-                                print(f"  Order voice: {voice.GetDescription()}")
+                        for meta in voice_meta:
+                            if "male" in meta["name"].lower() or "david" in meta["name"].lower():
+                                order_meta = meta
                                 break
+                    if order_meta is not None:
+                        self.sapi_speaker_order = self.sapi_speaker
+                        self._sapi_voices["sapi_speaker_order"] = order_meta["obj"]
+                        print(f"  Order voice: {order_meta['name']}")
                 
                 self.tts_method = "win32com_sapi"
                 print("TTS initialized: Windows SAPI (win32com)")
                 
-                # Test TTS
+                # Warm up the voice with a silent utterance (loads the engine before the first greeting)
                 try:
-                    self.sapi_speaker.Speak("TTS test", 0)
-                    print("  ✓ TTS test successful")
+                    self.sapi_speaker.Speak(" ", SVSF_ASYNC)
+                    self.sapi_speaker.WaitUntilDone(2000)
+                    print("  ✓ TTS warmed up")
                 except Exception as test_e:
                     print(f"  ⚠ SAPI test failed: {test_e}")
                     self.sapi_speaker = None
                     self.sapi_speaker_order = None
                     print("  Trying pyttsx3...")
                     try:
-                        import pyttsx3
                         self.tts_engine = pyttsx3.init()
                         self.tts_method = "pyttsx3"
                         voices = self.tts_engine.getProperty('voices')
@@ -384,13 +865,11 @@ class DriveThruSystem:
                         self.tts_method = "win32com_sapi"  # keep so speak() will try SAPI then runtime pyttsx3 fallback
             except Exception as e:
                 print(f"Warning: Failed to initialize Windows SAPI: {e}")
-                import traceback
                 traceback.print_exc()
                 self.tts_method = None
                 self.sapi_speaker = None
         elif TTS_ENGINE == "pyttsx3":
             try:
-                import pyttsx3
                 self.tts_engine = pyttsx3.init()
                 
                 # Stop any existing speech
@@ -442,18 +921,16 @@ class DriveThruSystem:
                 self.tts_method = "pyttsx3"
                 print("TTS initialized: pyttsx3")
                 
-                # Test TTS with a short phrase - VERIFY AUDIO OUTPUT
-                print("  Testing TTS audio output...")
+                # Warm up the engine with a silent utterance so the first greeting starts promptly
                 try:
-                    self.tts_engine.say("TTS test")
+                    self.tts_engine.say("")
                     self.tts_engine.runAndWait()
-                    print("  ✓ TTS test completed - did you hear 'TTS test'?")
+                    print("  ✓ TTS warmed up")
                 except Exception as test_e:
-                    print(f"  ⚠ TTS test failed: {test_e}")
+                    print(f"  ⚠ TTS warm-up failed: {test_e}")
                     
             except Exception as e:
                 print(f"Warning: Failed to initialize pyttsx3: {e}")
-                import traceback
                 traceback.print_exc()
                 self.tts_method = None
                 self.tts_engine = None
@@ -461,7 +938,16 @@ class DriveThruSystem:
             # Check if espeak is available
             if shutil.which("espeak"):
                 self.tts_method = "espeak"
-                print("TTS initialized: espeak")
+                self._libespeak = self._setup_libespeak()
+                if self._libespeak is not None:
+                    print("TTS initialized: espeak (libespeak, in-process)")
+                else:
+                    print("TTS initialized: espeak")
+                    # Quiet run (-q, no audio) pulls espeak and its voice data into the page cache
+                    try:
+                        subprocess.call(['espeak', '-q', ' '], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
+                    except (OSError, subprocess.TimeoutExpired):
+                        pass
             else:
                 print("Warning: espeak not found. TTS will be disabled.")
                 self.tts_method = None
@@ -471,30 +957,222 @@ class DriveThruSystem:
         if self.tts_method:
             print("  If you can't hear voice: check Windows volume, default speaker, and that no app is muting audio.")
     
+    def _setup_libespeak(self):
+        """
+        Load libespeak(-ng) via ctypes and initialize it once for synchronous playback.
+        Speaking in-process skips the fork+exec of the espeak binary per utterance.
+        Returns the library handle, or None to keep using the espeak command.
+        """
+        path = ctypes.util.find_library("espeak-ng") or ctypes.util.find_library("espeak")
+        if not path:
+            return None
+        try:
+            lib = ctypes.CDLL(path)
+            lib.espeak_Synth.argtypes = [ctypes.c_char_p, ctypes.c_size_t, ctypes.c_uint, ctypes.c_int,
+                                         ctypes.c_uint, ctypes.c_uint, ctypes.c_void_p, ctypes.c_void_p]
+            # AUDIO_OUTPUT_SYNCH_PLAYBACK (3): espeak plays the audio itself and espeak_Synth returns once it has
+            # played (2, AUDIO_OUTPUT_SYNCHRONOUS, only hands samples to a synth callback and plays nothing)
+            if lib.espeak_Initialize(3, 0, None, 0) <= 0:
+                return None
+            lib.espeak_SetParameter(1, self.config.get("tts_rate", 150), 0)  # espeakRATE
+            lib.espeak_SetParameter(2, 200, 0)  # espeakVOLUME, same as espeak -a 200
+            return lib
+        except (OSError, AttributeError) as e:
+            print(f"  libespeak unavailable ({e}), using espeak command")
+            return None
+    
+    def _speak_libespeak(self, text: str):
+        """Speak text through libespeak; blocks until playback finishes."""
+        data = text.encode("utf-8")
+        # POS_CHARACTER (1), espeakCHARS_UTF8 (1)
+        result = self._libespeak.espeak_Synth(data, len(data) + 1, 0, 1, 0, 1, None, None)
+        if result != 0:
+            raise RuntimeError(f"espeak_Synth returned error code {result}")
+    
     def _clean_text_for_speech(self, text: str) -> str:
         """Clean text for better TTS pronunciation"""
-        # Replace dollar signs with "dollars"
-        text = text.replace("$", " dollars ")
-        # Replace dashes with pauses
-        text = text.replace(" - ", ". ")
-        # Replace colons with pauses  
-        text = text.replace(": ", ". ")
-        # Clean up multiple spaces
-        text = " ".join(text.split())
-        return text
+        return _clean_cached(text)
+    
+    def _setup_tts_cache(self) -> Optional[str]:
+        """Return the TTS audio cache directory, or None if caching can't be used with this engine/platform."""
+        if not self.config.get("tts_cache", True) or self.tts_method not in CACHEABLE_TTS_METHODS:
+            return None
+        if self.tts_method == "espeak" and self._libespeak is not None:
+            # In-process libespeak speaks any phrase with no fork at all; the cache would add an espeak
+            # render and an aplay process per phrase
+            print("  TTS cache not used: libespeak speaks in-process")
+            return None
+        if winsound is None and not shutil.which("aplay"):
+            print("  TTS cache disabled: no audio player (install alsa-utils for aplay)")
+            return None
+        cache_dir = self.config.get("tts_cache_dir", "tts_cache")
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+        except OSError as e:
+            print(f"  TTS cache disabled: {e}")
+            return None
+        print(f"  TTS cache: {cache_dir}")
+        return cache_dir
+    
+    def _tts_cache_path(self, text: str, speaker_attr: str = "sapi_speaker") -> Optional[str]:
+        """WAV path for text, keyed by engine, voice, rate and the cleaned text."""
+        if self.tts_method == "win32com_sapi":
+            speaker = getattr(self, speaker_attr, None)
+            if speaker is None:
+                return None
+            voice_id = (self._sapi_voice(speaker_attr) or speaker.Voice).Id
+        elif self.tts_method == "pyttsx3":
+            if getattr(self, "tts_engine", None) is None:
+                return None
+            voice_id = self.tts_engine.getProperty('voice')
+        else:
+            voice_id = "default"
+        key = f"{self.tts_method}|{voice_id}|{self.config.get('tts_rate', 150)}|{text}"
+        return os.path.join(self._tts_cache_dir, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".wav")
+    
+    def _render_tts_to_wav(self, text: str, path: str, speaker_attr: str = "sapi_speaker"):
+        """Synthesize text into a WAV file (written to a temp name first so a failed render leaves no cache entry)."""
+        tmp_path = path + ".tmp"
+        if self.tts_method == "win32com_sapi":
+            speaker = getattr(self, speaker_attr)
+            # Separate SpVoice for file output so the live speakers keep their audio device
+            if getattr(self, "_sapi_file_voice", None) is None:
+                self._sapi_file_voice = win32com.client.Dispatch("SAPI.SpVoice")
+            file_voice = self._sapi_file_voice
+            file_voice.Voice = self._sapi_voice(speaker_attr) or speaker.Voice
+            file_voice.Rate = speaker.Rate
+            file_voice.Volume = speaker.Volume
+            stream = win32com.client.Dispatch("SAPI.SpFileStream")
+            stream.Open(tmp_path, 3)  # SSFMCreateForWrite
+            try:
+                file_voice.AudioOutputStream = stream
+                file_voice.Speak(text, 0)
+            finally:
+                stream.Close()
+        elif self.tts_method == "pyttsx3":
+            self.tts_engine.save_to_file(text, tmp_path)
+            self.tts_engine.runAndWait()
+            if not os.path.exists(tmp_path):
+                raise RuntimeError("pyttsx3 did not write the audio file")
+        else:
+            rate = self.config.get("tts_rate", 150)
+            result = subprocess.call(['espeak', '-s', str(rate), '-a', '200', '-w', tmp_path, text],
+                                     stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            if result != 0:
+                raise RuntimeError(f"espeak returned error code {result}")
+        os.replace(tmp_path, path)
+    
+    def _wav_bytes(self, path: str) -> bytes:
+        """Contents of a cached WAV, kept in RAM for the most recently played phrases (LRU)."""
+        data = self._wav_memory.get(path)
+        if data is not None:
+            self._wav_memory.move_to_end(path)
+            return data
+        with open(path, 'rb') as f:
+            data = f.read()
+        self._wav_memory[path] = data
+        if len(self._wav_memory) > self.config.get("tts_memory_cache_items", 16):
+            self._wav_memory.popitem(last=False)
+        return data
+    
+    def _play_wav(self, path: str):
+        """Play a cached WAV and wait for it to finish (from memory: no file read or open per play)."""
+        data = self._wav_bytes(path)
+        if winsound is not None:
+            winsound.PlaySound(data, winsound.SND_MEMORY)
+        else:
+            result = subprocess.run(['aplay', '-q', '-'], input=data,
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode
+            if result != 0:
+                raise RuntimeError(f"aplay returned error code {result}")
+    
+    def _speak_cached(self, text: str, speaker_attr: str = "sapi_speaker") -> bool:
+        """Play text from the TTS cache, rendering it on a miss. Returns False if the caller should speak live
+        (always for text outside the fixed phrases and menu, see CACHED_PHRASES)."""
+        if not self._tts_cache_dir or self.tts_method not in CACHEABLE_TTS_METHODS:
+            return False
+        if text not in self._cacheable_texts:
+            return False
+        try:
+            path = self._tts_cache_path(text, speaker_attr)
+            if path is None:
+                return False
+            if not os.path.exists(path):
+                self._render_tts_to_wav(text, path, speaker_attr)
+            self._play_wav(path)
+            return True
+        except Exception as e:
+            print(f"  TTS cache unavailable ({e}), speaking live")
+            return False
+    
+    def _preprocess_offer(self, offer: str) -> MenuItem:
+        """Spoken and cleaned forms of a menu offer, computed once instead of on every recitation."""
+        spoken = self._spoken_offer(offer)
+        return MenuItem(offer, spoken, self._clean_text_for_speech(spoken), None)
+    
+    def _prewarm_tts_cache(self):
+        """Render the fixed phrases and menu items into the cache so the first car doesn't wait on synthesis,
+        and delete any other WAVs in the cache directory (other voices/rates, or text cached by older versions)."""
+        if not getattr(self, "_tts_cache_dir", None):
+            return
+        rendered = 0
+        keep = set()
+        try:
+            for phrase in CACHED_PHRASES:
+                text = self._clean_text_for_speech(phrase)
+                path = self._tts_cache_path(text)
+                rendered += self._render_if_missing(text, path)
+                keep.add(path)
+            for i, item in enumerate(self._menu[:4]):
+                path = self._tts_cache_path(item.cleaned)
+                rendered += self._render_if_missing(item.cleaned, path)
+                keep.add(path)
+                self._menu[i] = item._replace(wav_path=path)
+            for name in os.listdir(self._tts_cache_dir):
+                path = os.path.join(self._tts_cache_dir, name)
+                if name.endswith(".wav") and path not in keep:
+                    os.remove(path)
+        except Exception as e:
+            print(f"  ⚠ TTS cache pre-render failed: {e}")
+            return
+        if rendered:
+            print(f"  ✓ Pre-rendered {rendered} menu phrases into TTS cache")
+    
+    def _render_if_missing(self, text: str, path: Optional[str]) -> bool:
+        if path and not os.path.exists(path):
+            self._render_tts_to_wav(text, path)
+            return True
+        return False
     
-    def _sapi_speak_with_retry(self, text: str, speaker_attr: str = "sapi_speaker"):
+    def _find_voice(self, name: str) -> Optional[Dict]:
+        """SAPI voice metadata for a configured name: exact (case-insensitive) match, else first name containing it."""
+        norm = name.strip().lower()
+        meta = self._voice_by_name.get(norm)
+        if meta is None:
+            meta = next((m for key, m in self._voice_by_name.items() if norm in key), None)
+        return meta
+    
+    def _sapi_voice(self, speaker_attr: str):
+        """Voice token configured for a speaker role, or None if the role has no fixed voice."""
+        return getattr(self, "_sapi_voices", {}).get(speaker_attr)
+    
+    def _sapi_speak_with_retry(self, text: str, speaker_attr: str = "sapi_speaker", flags: int = 0):
         """Call SAPI Speak with one retry on failure (avoids intermittent 0x8004503A)."""
         speaker = getattr(self, speaker_attr, None)
         if not speaker:
             return
+        # Menu and order roles share one SpVoice: switch its voice only when the role changes
+        voice = self._sapi_voice(speaker_attr)
+        if voice is not None and getattr(self, "_sapi_active_role", None) != speaker_attr:
+            speaker.Voice = voice
+            self._sapi_active_role = speaker_attr
         try:
-            speaker.Speak(text, 0)
+            speaker.Speak(text, flags)
         except Exception as e:
             print(f"  SAPI first attempt failed: {e}, retrying after delay...")
             time.sleep(0.6)
             try:
-                speaker.Speak(text, 0)
+                speaker.Speak(text, flags)
             except Exception as e2:
                 raise e2
     
@@ -502,7 +1180,6 @@ class DriveThruSystem:
         """Speak using pyttsx3 (lazy init if needed). Returns True if successful."""
         try:
             if not getattr(self, 'tts_engine', None):
-                import pyttsx3
                 self.tts_engine = pyttsx3.init()
                 for v in self.tts_engine.getProperty('voices') or []:
                     if 'zira' in v.name.lower() or 'female' in v.name.lower():
@@ -515,21 +1192,21 @@ class DriveThruSystem:
             print(f"  pyttsx3 fallback error: {e}")
             return False
     
-    def _speak_sapi_in_chunks(self, text: str, max_length: int):
-        """Speak long text in short chunks via SAPI to avoid driver errors."""
-        parts = text.split(". ")
-        chunk = ""
-        for i, part in enumerate(parts):
-            if len(chunk) + len(part) + 2 <= max_length:
-                chunk += part + ". "
-            else:
-                if chunk.strip():
-                    time.sleep(0.2)
-                    self._sapi_speak_with_retry(chunk.strip())
-                chunk = part + ". "
-        if chunk.strip():
-            time.sleep(0.2)
-            self._sapi_speak_with_retry(chunk.strip())
+    def _speak_sapi_in_chunks(self, text: str, max_length: int, speaker_attr: str = "sapi_speaker"):
+        """
+        Speak long text in short chunks via SAPI to avoid driver errors.
+        Chunks are queued asynchronously, so the first one plays while SAPI renders the rest;
+        returns once the whole text has been spoken.
+        """
+        for chunk in _sentence_chunks(text, max_length):
+            if chunk.strip():
+                self._sapi_speak_with_retry(chunk.strip(), speaker_attr, SVSF_ASYNC)
+        speaker = getattr(self, speaker_attr, None)
+        if speaker:
+            while not speaker.WaitUntilDone(200):
+                if self._cancel.is_set():
+                    speaker.Speak("", SVSF_ASYNC | SVSF_PURGE)  # shutting down: drop the rest of the text
+                    break
     
     def _speak_in_chunks(self, text: str, max_length: int = 100):
         """Speak long text in smaller chunks to avoid TTS issues"""
@@ -538,44 +1215,30 @@ class DriveThruSystem:
             self.speak(text)
             return
         
-        # Break into sentences or phrases
-        sentences = text.split('. ')
-        current_chunk = ""
-        
-        for sentence in sentences:
-            if len(current_chunk) + len(sentence) + 2 <= max_length:
-                current_chunk += sentence + ". "
-            else:
-                if current_chunk:
-                    self.speak(current_chunk.strip())
-                    time.sleep(0.5)
-                current_chunk = sentence + ". "
-        
-        # Speak remaining chunk
-        if current_chunk:
-            self.speak(current_chunk.strip())
+        # Break into sentences, grouped up to max_length
+        for i, chunk in enumerate(_sentence_chunks(text, max_length)):
+            if self._cancel.is_set():
+                return
+            if i:
+                time.sleep(0.5)
+            self.speak(chunk)
     
+    @_on_voice_thread
     def speak_order(self, text: str):
         """Speak with ORDER voice (different from menu voice)"""
+        if self._cancel.is_set():
+            return
         cleaned_text = self._clean_text_for_speech(text)
         print(f"\n[ORDER VOICE]: {text}")
         
         if self.tts_method == "win32com_sapi" and getattr(self, 'sapi_speaker_order', None):
             try:
                 time.sleep(0.25)
+                if self._speak_cached(cleaned_text, "sapi_speaker_order"):
+                    print("[TTS] ✓ Order read-back completed (cached audio)")
+                    return
                 if len(cleaned_text) > 80:
-                    parts = cleaned_text.split(". ")
-                    chunk, rest = "", parts
-                    for part in rest:
-                        if len(chunk) + len(part) + 2 <= 80:
-                            chunk += part + ". "
-                        else:
-                            if chunk.strip():
-                                self._sapi_speak_with_retry(chunk.strip(), "sapi_speaker_order")
-                                time.sleep(0.2)
-                            chunk = part + ". "
-                    if chunk.strip():
-                        self._sapi_speak_with_retry(chunk.strip(), "sapi_speaker_order")
+                    self._speak_sapi_in_chunks(cleaned_text, 80, "sapi_speaker_order")
                 else:
                     self._sapi_speak_with_retry(cleaned_text, "sapi_speaker_order")
                 print("[TTS] ✓ Order read-back completed")
@@ -585,128 +1248,238 @@ class DriveThruSystem:
         else:
             self.speak(text)
     
+    @property
+    def tts_method(self) -> Optional[str]:
+        return self._tts_method
+    
+    @tts_method.setter
+    def tts_method(self, method: Optional[str]):
+        # A runtime switch (e.g. SAPI failing over to pyttsx3) re-points speak() here too
+        self._tts_method = method
+        self._speak_impl = getattr(self, self._TTS_BACKENDS.get(method, "_speak_unavailable"))
+    
+    @_on_voice_thread
     def speak(self, text: str):
         """Convert text to speech and play (menu voice)"""
+        if self._cancel.is_set():
+            return
         # Clean text for better TTS
         cleaned_text = self._clean_text_for_speech(text)
         
         print(f"\n[SYSTEM SPEAKING]: {text}")
         print(f"[CLEANED TEXT]: {cleaned_text}")
         print(f"[TTS METHOD]: {self.tts_method}")
-        
-        if self.tts_method == "win32com_sapi":
-            # Windows SAPI - use chunks + retry to avoid 0x8004503A / -2147200966
-            try:
-                if not hasattr(self, 'sapi_speaker') or self.sapi_speaker is None:
-                    print("❌ ERROR: SAPI speaker not initialized!")
-                    print("   Attempting to reinitialize...")
-                    try:
-                        import win32com.client
-                        self.sapi_speaker = win32com.client.Dispatch("SAPI.SpVoice")
-                        print("   ✓ SAPI speaker reinitialized")
-                    except Exception as e2:
-                        print(f"   ❌ Failed to reinitialize: {e2}")
-                        return
-                
-                # Long text: speak in chunks to avoid SAPI failures
-                SAPI_MAX_CHARS = 80
-                if len(cleaned_text) > SAPI_MAX_CHARS:
-                    self._speak_sapi_in_chunks(cleaned_text, SAPI_MAX_CHARS)
-                    return
-                
-                print("[TTS] Speaking via Windows SAPI...")
-                time.sleep(0.25)  # let previous speech release
-                self._sapi_speak_with_retry(cleaned_text)
-                print("[TTS] ✓ Speech completed")
-            except Exception as e:
-                print(f"⚠ SAPI failed, trying pyttsx3: {e}")
-                if self._speak_with_pyttsx3_fallback(cleaned_text):
-                    self.tts_method = "pyttsx3"  # use pyttsx3 from now on, skip SAPI
-                    print("[TTS] ✓ Speech completed (switched to pyttsx3)")
-                else:
-                    print(f"❌ TTS failed (SAPI and pyttsx3)")
-        elif self.tts_method == "pyttsx3":
-            try:
-                if not hasattr(self, 'tts_engine') or self.tts_engine is None:
-                    print("❌ ERROR: TTS engine not initialized!")
-                    print("   Attempting to reinitialize...")
-                    try:
-                        import pyttsx3
-                        self.tts_engine = pyttsx3.init()
-                        print("   ✓ TTS engine reinitialized")
-                    except Exception as e2:
-                        print(f"   ❌ Failed to reinitialize: {e2}")
-                        return
-                
-                # Stop any current speech first
-                try:
-                    self.tts_engine.stop()
-                except:
-                    pass
-                
-                print("[TTS] Sending text to pyttsx3...")
-                print(f"[TTS] Text length: {len(cleaned_text)} characters")
-                
-                # CRITICAL: Stop any previous speech first
+        self._speak_impl(cleaned_text)
+    
+    def _speak_sapi(self, cleaned_text: str):
+        """Windows SAPI backend of speak()."""
+        # Windows SAPI - use chunks + retry to avoid 0x8004503A / -2147200966
+        try:
+            if not hasattr(self, 'sapi_speaker') or self.sapi_speaker is None:
+                print("❌ ERROR: SAPI speaker not initialized!")
+                print("   Attempting to reinitialize...")
                 try:
-                    self.tts_engine.stop()
-                except:
-                    pass
-                
-                # Use cleaned text for better pronunciation
-                self.tts_engine.say(cleaned_text)
-                print("[TTS] Running TTS engine (this may take a moment)...")
-                print("[TTS] ⚠ LISTEN NOW - Audio should be playing!")
-                
-                # Run and wait - this blocks until speech completes
-                self.tts_engine.runAndWait()
-                
-                # Small delay to ensure speech completes
-                time.sleep(0.5)
-                
-                print("[TTS] ✓ Speech completed - did you hear it?")
-            except Exception as e:
-                print(f"❌ ERROR: TTS error: {e}")
-                import traceback
-                traceback.print_exc()
-                # Try to reinitialize for next time
+                    self.sapi_speaker = win32com.client.Dispatch("SAPI.SpVoice")
+                    if "sapi_speaker_order" in getattr(self, "_sapi_voices", {}):
+                        self.sapi_speaker_order = self.sapi_speaker
+                    self._sapi_active_role = None  # apply the role's voice on the next Speak
+                    print("   ✓ SAPI speaker reinitialized")
+                except Exception as e2:
+                    print(f"   ❌ Failed to reinitialize: {e2}")
+                    return
+            
+            # Repeated phrases (greeting, menu items) play from the WAV cache
+            if self._speak_cached(cleaned_text):
+                print("[TTS] ✓ Speech completed (cached audio)")
+                return
+            
+            # Long text: speak in chunks to avoid SAPI failures
+            SAPI_MAX_CHARS = 80
+            if len(cleaned_text) > SAPI_MAX_CHARS:
+                self._speak_sapi_in_chunks(cleaned_text, SAPI_MAX_CHARS)
+                return
+            
+            print("[TTS] Speaking via Windows SAPI...")
+            time.sleep(0.25)  # let previous speech release
+            self._sapi_speak_with_retry(cleaned_text)
+            print("[TTS] ✓ Speech completed")
+        except Exception as e:
+            print(f"⚠ SAPI failed, trying pyttsx3: {e}")
+            if self._speak_with_pyttsx3_fallback(cleaned_text):
+                self.tts_method = "pyttsx3"  # use pyttsx3 from now on, skip SAPI
+                print("[TTS] ✓ Speech completed (switched to pyttsx3)")
+            else:
+                print(f"❌ TTS failed (SAPI and pyttsx3)")
+    
+    def _speak_pyttsx3(self, cleaned_text: str):
+        """pyttsx3 backend of speak()."""
+        try:
+            if not hasattr(self, 'tts_engine') or self.tts_engine is None:
+                print("❌ ERROR: TTS engine not initialized!")
+                print("   Attempting to reinitialize...")
                 try:
-                    import pyttsx3
                     self.tts_engine = pyttsx3.init()
-                    print("   ✓ TTS engine reinitialized after error")
-                except:
-                    pass
-        elif self.tts_method == "espeak":
+                    print("   ✓ TTS engine reinitialized")
+                except Exception as e2:
+                    print(f"   ❌ Failed to reinitialize: {e2}")
+                    return
+            
+            # Stop any current speech first
             try:
-                rate = self.config.get("tts_rate", 150)
-                print(f"[TTS] Calling espeak with rate {rate}...")
-                # Use cleaned text
-                result = subprocess.call(['espeak', '-s', str(rate), '-a', '200', cleaned_text], 
-                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                if result == 0:
-                    print("[TTS] ✓ Speech completed successfully")
-                else:
-                    print(f"❌ [TTS] Warning: espeak returned error code {result}")
-            except FileNotFoundError:
-                print("❌ ERROR: espeak not found. Please install: sudo apt-get install espeak")
+                self.tts_engine.stop()
+            except:
+                pass
+            
+            # Repeated phrases (greeting, menu items) play from the WAV cache
+            if self._speak_cached(cleaned_text):
+                print("[TTS] ✓ Speech completed (cached audio)")
+                return
+            
+            print("[TTS] Sending text to pyttsx3...")
+            print(f"[TTS] Text length: {len(cleaned_text)} characters")
+            
+            # CRITICAL: Stop any previous speech first
+            try:
+                self.tts_engine.stop()
+            except:
+                pass
+            
+            self.tts_engine.say(cleaned_text)
+            print("[TTS] Running TTS engine (this may take a moment)...")
+            print("[TTS] ⚠ LISTEN NOW - Audio should be playing!")
+            
+            # Run and wait - this blocks until speech completes
+            self.tts_engine.runAndWait()
+            
+            # Small delay to ensure speech completes
+            time.sleep(0.5)
+            
+            print("[TTS] ✓ Speech completed - did you hear it?")
+        except Exception as e:
+            print(f"❌ ERROR: TTS error: {e}")
+            traceback.print_exc()
+            # Try to reinitialize for next time
+            try:
+                self.tts_engine = pyttsx3.init()
+                print("   ✓ TTS engine reinitialized after error")
+            except:
+                pass
+    
+    def _speak_espeak(self, cleaned_text: str):
+        """espeak backend of speak() (Linux / Raspberry Pi)."""
+        try:
+            if self._libespeak is not None:
+                self._speak_libespeak(cleaned_text)
+                print("[TTS] ✓ Speech completed successfully")
+                return
+            if self._speak_cached(cleaned_text):
+                print("[TTS] ✓ Speech completed (cached audio)")
+                return
+            rate = self.config.get("tts_rate", 150)
+            print(f"[TTS] Calling espeak with rate {rate}...")
+            # Use cleaned text
+            result = subprocess.call(['espeak', '-s', str(rate), '-a', '200', cleaned_text], 
+                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            if result == 0:
+                print("[TTS] ✓ Speech completed successfully")
+            else:
+                print(f"❌ [TTS] Warning: espeak returned error code {result}")
+        except FileNotFoundError:
+            print("❌ ERROR: espeak not found. Please install: sudo apt-get install espeak")
+        except Exception as e:
+            print(f"❌ ERROR: TTS error: {e}")
+            traceback.print_exc()
+    
+    def _speak_unavailable(self, cleaned_text: str):
+        """No TTS engine: the text is only printed."""
+        # No TTS available - just print the text
+        print("❌ WARNING: TTS not available - text only (no audio)")
+        print("  Current tts_method:", self.tts_method)
+        print("  On Windows: pip install pyttsx3")
+        print("  On Linux: sudo apt-get install espeak")
+    
+    def _recognize_race(self, audio) -> str:
+        """Run Whisper and Google side by side on the STT pool and take the first usable transcript."""
+        futures = {
+            self._stt_pool.submit(self._transcribe_whisper, audio): "Whisper",
+            self._stt_pool.submit(self.recognizer.recognize_google, audio, language='en-US'): "Google",
+        }
+        pending = set(futures)
+        error = None
+        deadline = time.monotonic() + self.config.get("stt_timeout", 10.0)
+        while pending:
+            done, pending = wait(pending, timeout=max(0.0, deadline - time.monotonic()), return_when=FIRST_COMPLETED)
+            if not done:
+                print("⚠ Speech recognition timed out")
+                break
+            for future in done:
+                try:
+                    text = future.result()
+                except sr.UnknownValueError as e:
+                    error = e  # nothing intelligible (or only silence): not worth a warning
+                    continue
+                except Exception as e:
+                    print(f"⚠ {futures[future]} transcription failed: {e}")
+                    error = e
+                    continue
+                if text is not None:
+                    for other in pending:
+                        other.cancel()  # the loser's result is simply dropped if it is already running
+                    print(f"  [{futures[future]} answered first]")
+                    return text
+        if isinstance(error, (sr.UnknownValueError, sr.RequestError)):
+            raise error
+        raise sr.UnknownValueError()
+    
+    def _transcribe_audio(self, audio) -> str:
+        """
+        Transcribe captured audio locally with Whisper. Google Speech Recognition (a network round trip)
+        is only used when Whisper is off or can't load, or (raced against Whisper) with "google_stt_fallback": true.
+        Raises sr.UnknownValueError / sr.RequestError like recognize_google.
+        """
+        # Recent transcripts by audio digest (an identical buffer, e.g. a replayed test clip, skips the model)
+        key = hashlib.blake2b(audio.frame_data, digest_size=16).digest()
+        text = self._transcripts.get(key)
+        if text is not None:
+            self._transcripts.move_to_end(key)
+            return text
+        text = self._recognize(audio)
+        self._transcripts[key] = text
+        if len(self._transcripts) > 64:
+            self._transcripts.popitem(last=False)
+        return text
+    
+    def _recognize(self, audio) -> str:
+        if self.use_whisper and self.config.get("google_stt_fallback", False):
+            return self._recognize_race(audio)
+        if self.use_whisper:
+            try:
+                text = self._transcribe_whisper(audio)
+                if text is not None:
+                    return text
+            except sr.UnknownValueError:
+                raise  # only silence / noise or an empty transcript, not a model failure
             except Exception as e:
-                print(f"❌ ERROR: TTS error: {e}")
-                import traceback
-                traceback.print_exc()
-        else:
-            # No TTS available - just print the text
-            print("❌ WARNING: TTS not available - text only (no audio)")
-            print("  Current tts_method:", self.tts_method)
-            print("  On Windows: pip install pyttsx3")
-            print("  On Linux: sudo apt-get install espeak")
+                print(f"⚠ Whisper transcription failed: {e}")
+                raise sr.UnknownValueError()
+        return self.recognizer.recognize_google(audio, language='en-US')
     
+    @_on_voice_thread
     def listen(self, timeout: float = 15.0, phrase_time_limit: int = 30) -> Optional[str]:
         """Listen for voice input and return transcribed text (captures any words)"""
+        if self._cancel.is_set():
+            return None
         if self.microphone is None:
             print("\n⚠ No microphone available. Connect a mic or set default in Windows Sound settings.\n")
             return None
         try:
-            with self.microphone as source:
+            if self._ensure_vosk() is not None:
+                print(f"\n🎤 [LISTENING NOW - streaming] Speak when ready... (Timeout: {timeout}s)")
+                text = self._listen_streaming(timeout, phrase_time_limit)
+                if text is not None:
+                    print(f"\n✓ [CUSTOMER SAID - Vosk]: {text}\n")
+                    return text
+            with self._mic_lock, self.microphone as source:
                 print(f"\n🎤 [LISTENING NOW] Speak when ready...")
                 if self.use_whisper:
                     print(f"   Using Whisper for better accuracy")
@@ -714,43 +1487,13 @@ class DriveThruSystem:
                 print("   ⚠ SPEAK NOW - I'm listening!\n")
                 
                 # Listen with longer timeout and phrase limit for natural speech
-                # Set energy_threshold lower to be more sensitive
-                self.recognizer.energy_threshold = 300  # Lower threshold = more sensitive
+                # Start from the calibrated threshold (lower = more sensitive)
+                self.recognizer.energy_threshold = self._energy_threshold
                 audio = self.recognizer.listen(source, timeout=timeout, phrase_time_limit=phrase_time_limit)
             
             print("\n[PROCESSING] Transcribing your speech...")
             
-            # Use Whisper if available (better accuracy), otherwise Google Speech Recognition
-            if self.use_whisper and self.whisper_model:
-                try:
-                    # Save audio to temporary file for Whisper
-                    import tempfile
-                    import wave
-                    import io
-                    
-                    # Convert audio data to WAV format
-                    wav_data = io.BytesIO()
-                    with wave.open(wav_data, 'wb') as wav_file:
-                        wav_file.setnchannels(1)  # Mono
-                        wav_file.setsampwidth(audio.sample_width)
-                        wav_file.setframerate(audio.sample_rate)
-                        wav_file.writeframes(audio.frame_data)
-                    
-                    wav_data.seek(0)
-                    
-                    # Transcribe with Whisper
-                    result = self.whisper_model.transcribe(wav_data, language="en", fp16=False)
-                    text = result["text"].strip()
-                    
-                    print(f"\n✓ [CUSTOMER SAID - Whisper]: {text}\n")
-                    return text
-                except Exception as e:
-                    print(f"⚠ Whisper transcription failed: {e}")
-                    print("  Falling back to Google Speech Recognition...")
-                    # Fall through to Google recognition
-            
-            # Fallback to Google Speech Recognition
-            text = self.recognizer.recognize_google(audio, language='en-US')
+            text = self._transcribe_audio(audio)
             print(f"\n✓ [CUSTOMER SAID]: {text}\n")
             return text  # Return original case for better readability
             
@@ -767,8 +1510,11 @@ class DriveThruSystem:
             print("   Check internet connection\n")
             return None
     
+    @_on_voice_thread
     def listen_continuous(self, max_duration: int = 60) -> List[str]:
         """Listen continuously and capture multiple phrases until customer finishes"""
+        if self._cancel.is_set():
+            return []
         if self.microphone is None:
             print("\n⚠ No microphone available. Connect a mic or set default in Windows Sound settings.\n")
             return []
@@ -780,76 +1526,104 @@ class DriveThruSystem:
         print("   Say 'done', 'that's all', or 'finished' when you're done ordering")
         print("   ⚠ START SPEAKING NOW - I'm listening!\n")
         
-        # Lower energy threshold for better sensitivity
-        self.recognizer.energy_threshold = 300
+        # Start from the calibrated threshold (lower = more sensitive)
+        self.recognizer.energy_threshold = self._energy_threshold
         
-        start_time = time.time()
+        # The mic keeps capturing on its own thread while the previous phrase is transcribed here
+        audio_q = queue.Queue(maxsize=4)
+        stop = threading.Event()
+        producer = threading.Thread(target=self._capture_phrases, args=(audio_q, stop, time.time() + max_duration),
+                                    name="capture", daemon=True)
+        producer.start()
         silence_count = 0
         max_silence = 4  # Stop after 4 seconds of silence
         
-        while (time.time() - start_time) < max_duration:
-            try:
-                with self.microphone as source:
-                    print("   🎤 Listening... (speak now)")
-                    audio = self.recognizer.listen(source, timeout=3.0, phrase_time_limit=20)
-                
-                print("   [Processing...]")
-                
-                # Use Whisper if available, otherwise Google
-                if self.use_whisper and self.whisper_model:
-                    try:
-                        import tempfile
-                        import wave
-                        import io
-                        
-                        wav_data = io.BytesIO()
-                        with wave.open(wav_data, 'wb') as wav_file:
-                            wav_file.setnchannels(1)
-                            wav_file.setsampwidth(audio.sample_width)
-                            wav_file.setframerate(audio.sample_rate)
-                            wav_file.writeframes(audio.frame_data)
-                        
-                        wav_data.seek(0)
-                        result = self.whisper_model.transcribe(wav_data, language="en", fp16=False)
-                        text = result["text"].strip()
-                    except Exception as e:
-                        print(f"   ⚠ Whisper failed: {e}, using Google...")
-                        text = self.recognizer.recognize_google(audio, language='en-US')
-                else:
-                    text = self.recognizer.recognize_google(audio, language='en-US')
-                
-                print(f"\n   ✓ [CAPTURED]: {text}\n")
-                
-                # Check for completion phrases
-                text_lower = text.lower()
-                if any(phrase in text_lower for phrase in ["done", "that's all", "that's it", "finished", "that will be all", "complete"]):
-                    print("   ✓ [ORDER COMPLETE] Customer finished ordering\n")
-                    phrases.append(text)
+        try:
+            while True:
+                kind, item = audio_q.get()
+                if kind == "end":
                     break
-                
-                phrases.append(text)
-                silence_count = 0
-                print("   Continue speaking or say 'done' when finished...\n")
-                
-            except sr.WaitTimeoutError:
-                silence_count += 1
-                if silence_count >= max_silence:
-                    print(f"\n   ⏱ [SILENCE DETECTED] No speech for {max_silence} seconds")
-                    print("   Assuming customer finished ordering.\n")
+                try:
+                    if kind == "error":
+                        raise item
+                    if kind == "timeout":
+                        raise sr.WaitTimeoutError()
+                    if kind == "audio":
+                        print("   [Processing...]")
+                        text = self._transcribe_audio(item)
+                    else:
+                        text = item
+                    
+                    print(f"\n   ✓ [CAPTURED]: {text}\n")
+                    
+                    # Check for completion phrases
+                    if _ORDER_DONE_RE.search(text.lower()):
+                        print("   ✓ [ORDER COMPLETE] Customer finished ordering\n")
+                        phrases.append(text)
+                        break
+                    
+                    phrases.append(text)
+                    silence_count = 0
+                    print("   Continue speaking or say 'done' when finished...\n")
+                    
+                except sr.WaitTimeoutError:
+                    silence_count += 1
+                    if silence_count >= max_silence:
+                        print(f"\n   ⏱ [SILENCE DETECTED] No speech for {max_silence} seconds")
+                        print("   Assuming customer finished ordering.\n")
+                        break
+                    print(f"   ... waiting ({silence_count}/{max_silence}) ...")
+                    continue
+                except sr.UnknownValueError:
+                    print("   ⚠ [PARTIAL] Could not understand some audio, continuing...")
+                    print("   Please repeat or continue speaking...\n")
+                    continue
+                except sr.RequestError as e:
+                    print(f"   ❌ [ERROR] Speech recognition service error: {e}")
+                    print("   Check internet connection\n")
                     break
-                print(f"   ... waiting ({silence_count}/{max_silence}) ...")
-                continue
-            except sr.UnknownValueError:
-                print("   ⚠ [PARTIAL] Could not understand some audio, continuing...")
-                print("   Please repeat or continue speaking...\n")
-                continue
-            except sr.RequestError as e:
-                print(f"   ❌ [ERROR] Speech recognition service error: {e}")
-                print("   Check internet connection\n")
-                break
+        finally:
+            # Not joined: an in-flight capture would add up to its timeout of dead air. The producer exits
+            # after it, and the next listen waits on _mic_lock until then.
+            stop.set()
         
         return phrases
     
+    def _capture_phrases(self, audio_q: "queue.Queue", stop: threading.Event, deadline: float):
+        """listen_continuous producer: capture phrases until stop is set or the deadline passes, queueing
+        ("audio", AudioData), ("text", str) from streaming, ("timeout", None), ("error", exc) and finally ("end", None)."""
+        def offer(item):
+            while not stop.is_set():
+                try:
+                    audio_q.put(item, timeout=0.2)
+                    return
+                except queue.Full:
+                    continue
+        
+        while not stop.is_set() and not self._cancel.is_set() and time.time() < deadline:
+            try:
+                with self._mic_lock:
+                    if stop.is_set():
+                        break  # stopped while waiting for the mic
+                    text = None
+                    if self._ensure_vosk() is not None:
+                        print("   🎤 Listening... (speak now, streaming)")
+                        text = self._listen_streaming(3.0, 20)
+                    if text is None:
+                        with self.microphone as source:
+                            print("   🎤 Listening... (speak now)")
+                            audio = self.recognizer.listen(source, timeout=3.0, phrase_time_limit=20)
+                if text is None:
+                    offer(("audio", audio))
+                else:
+                    offer(("text", text))
+            except sr.WaitTimeoutError:
+                offer(("timeout", None))
+            except Exception as e:
+                offer(("error", e))
+                break
+        offer(("end", None))
+    
     def detect_car_approach(self) -> bool:
         """
         Detect if a car has approached the drive-through loop.
@@ -862,6 +1636,83 @@ class DriveThruSystem:
             # Simulation mode for testing without hardware
             return False  # Will be triggered manually in test mode
     
+    def _spoken_offer(self, offer: str) -> str:
+        """Menu item as spoken: stripped, without a "Number N: " prefix."""
+        to_speak = offer.strip()
+        if to_speak.lower().startswith("number ") and ": " in to_speak:
+            to_speak = to_speak.split(": ", 1)[1]
+        return to_speak
+    
+    def _on_car_detected(self, channel):
+        """GPIO edge callback (runs on the RPi.GPIO thread): hand a car arrival to run()'s event loop."""
+        loop = self._loop
+        if loop is None:
+            return  # run() not started; it checks for a car already on the loop when it starts
+        try:
+            loop.call_soon_threadsafe(self.car_events.put_nowait, ("car_arrived", time.time()))
+        except RuntimeError:
+            pass  # event loop already closed (shutting down)
+    
+    def _record_arrival(self):
+        """Note a car arrival; refit the polling schedule every few cars."""
+        self._arrivals.append(time.time())
+        if len(self._arrivals) % 10 == 0:
+            self._fit_poll_schedule()
+    
+    def _fit_poll_schedule(self):
+        """
+        Poll delays after a car leaves, fitted to an exponential arrival model (lam = 1 / mean gap).
+        Each delay d' = (1 - exp(-lam * d)) / lam follows from the previous one, so polling starts
+        slow (no car expected yet) and tightens towards poll_interval_min; detection_interval caps it.
+        """
+        lo = self.config.get("poll_interval_min", 0.2)
+        hi = max(lo, self.config.get("detection_interval", 3.0))
+        times = self._arrivals
+        mean_gap = (times[-1] - times[0]) / (len(times) - 1) if len(times) > 1 else 0.0
+        if mean_gap <= 0:
+            self._poll_schedule = [lo]
+            return
+        lam = 1.0 / mean_gap
+        step = min(hi, mean_gap)
+        schedule = [max(lo, step)]
+        while step > lo and len(schedule) < 100:
+            step = (1.0 - math.exp(-lam * step)) / lam
+            schedule.append(max(lo, step))
+        self._poll_schedule = schedule
+        print(f"  Loop detector polling: mean gap {mean_gap:.0f}s, delays {schedule[0]:.2f}s → {schedule[-1]:.2f}s")
+    
+    def _drain_car_events(self):
+        """Discard queued arrivals, e.g. sensor bounce raised while the current car was being served."""
+        while True:
+            try:
+                self.car_events.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+    
+    def speak_blocking(self, text: str):
+        """speak() on the voice thread (where SAPI lives) and wait for it; same as speak(), which routes itself."""
+        self.speak(text)
+    
+    async def _in_voice_thread(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._voice_pool, func, *args)
+    
+    async def speak_async(self, text: str):
+        """speak() on the voice thread, without blocking the event loop."""
+        await self._in_voice_thread(self.speak, text)
+    
+    async def speak_order_async(self, text: str):
+        """speak_order() on the voice thread, without blocking the event loop."""
+        await self._in_voice_thread(self.speak_order, text)
+    
+    async def listen_async(self, timeout: float = 15.0, phrase_time_limit: int = 30) -> Optional[str]:
+        """listen() on the voice thread, without blocking the event loop."""
+        return await self._in_voice_thread(self.listen, timeout, phrase_time_limit)
+    
+    async def process_customer_async(self):
+        """process_customer() on the voice thread (menu, listen, handoff are one blocking conversation)."""
+        return await self._in_voice_thread(self.process_customer)
+    
+    @_on_voice_thread
     def announce_offers(self):
         """Announce KFC menu to the customer"""
         print("\n" + "="*70)
@@ -871,14 +1722,16 @@ class DriveThruSystem:
         print(f"Menu Items: {len(self.special_offers)}")
         print("="*70 + "\n")
         
-        greeting = "Welcome to KFC drive thru. These are the specials of the day."
+        greeting = MENU_GREETING
         print("[1/{}] Speaking greeting...".format(len(self.special_offers) + 2))
         self.speak(greeting)
-        time.sleep(1.5)
+        # Every backend returns only once playback has finished, so this is just the gap between phrases
+        pause = self.config.get("menu_item_pause", 0.5)
+        time.sleep(pause)
         
         # Menu: 4 choices (1-4). 0 = repeat, 6 = cancel.
         menu_choices = 4
-        offers_to_announce = self.special_offers[:menu_choices] if self.special_offers else []
+        offers_to_announce = self._menu[:menu_choices]
         if len(offers_to_announce) == 0:
             print("\n❌ ⚠ WARNING: No menu items to announce!")
             error_msg = "I'm sorry, but our menu system is not configured. Please tell our staff member what you'd like to order."
@@ -888,62 +1741,63 @@ class DriveThruSystem:
         print(f"\n📢 Now announcing {len(offers_to_announce)} menu items (say 1-4 to order, 0 repeat, 6 cancel)...\n")
         
         # Announce each menu item (first 5 only)
-        for i, offer in enumerate(offers_to_announce, 1):
+        for i, item in enumerate(offers_to_announce, 1):
+            if self._cancel.is_set():
+                return
             print(f"\n[{i+1}/{len(offers_to_announce) + 2}] MENU ITEM {i}:")
-            print(f"   Text: {offer[:70]}...")
+            print(f"   Text: {item.raw[:70]}...")
             print(f"   Speaking now...")
             
             try:
-                # Stop any previous speech first (important for pyttsx3)
-                if self.tts_method == "pyttsx3" and hasattr(self, 'tts_engine') and self.tts_engine:
-                    try:
-                        self.tts_engine.stop()
-                        time.sleep(0.2)  # Brief pause after stop
-                    except:
-                        pass
+                # Pre-rendered at start-up: just play the file
+                if item.wav_path and os.path.exists(item.wav_path):
+                    self._play_wav(item.wav_path)
+                    print(f"   ✓ Menu item {i} spoken successfully (cached audio)")
+                else:
+                    # Stop any previous speech first (important for pyttsx3)
+                    if self.tts_method == "pyttsx3" and hasattr(self, 'tts_engine') and self.tts_engine:
+                        try:
+                            self.tts_engine.stop()
+                            time.sleep(0.2)  # Brief pause after stop
+                        except:
+                            pass
                 
-                # Speak the menu item without "Number N: " prefix (no number repetition)
-                to_speak = offer.strip()
-                if to_speak.lower().startswith("number ") and ": " in to_speak:
-                    to_speak = to_speak.split(": ", 1)[1]
-                self.speak(to_speak)
+                    # Speak the menu item without "Number N: " prefix (no number repetition)
+                    self.speak(item.spoken)
                 
-                # Verify TTS is still working
-                if self.tts_method == "pyttsx3":
-                    if not hasattr(self, 'tts_engine') or self.tts_engine is None:
-                        print(f"   ⚠ WARNING: TTS engine lost after menu item {i}")
-                        # Try to reinitialize
-                        try:
-                            import pyttsx3
-                            self.tts_engine = pyttsx3.init()
-                            # Reconfigure
-                            self.tts_engine.setProperty('rate', self.config.get("tts_rate", 150))
-                            self.tts_engine.setProperty('volume', self.config.get("tts_volume", 0.9))
-                            print("   ✓ TTS engine reinitialized")
-                        except Exception as e:
-                            print(f"   ❌ Failed to reinitialize: {e}")
-                            break
+                    # Verify TTS is still working
+                    if self.tts_method == "pyttsx3":
+                        if not hasattr(self, 'tts_engine') or self.tts_engine is None:
+                            print(f"   ⚠ WARNING: TTS engine lost after menu item {i}")
+                            # Try to reinitialize
+                            try:
+                                self.tts_engine = pyttsx3.init()
+                                # Reconfigure
+                                self.tts_engine.setProperty('rate', self.config.get("tts_rate", 150))
+                                self.tts_engine.setProperty('volume', self.config.get("tts_volume", 0.9))
+                                print("   ✓ TTS engine reinitialized")
+                            except Exception as e:
+                                print(f"   ❌ Failed to reinitialize: {e}")
+                                break
                 
-                print(f"   ✓ Menu item {i} spoken successfully")
+                    print(f"   ✓ Menu item {i} spoken successfully")
                 
             except Exception as e:
                 print(f"   ❌ ERROR speaking menu item {i}: {e}")
-                import traceback
                 traceback.print_exc()
                 # Try to continue with next item
                 try:
                     if self.tts_method == "pyttsx3":
-                        import pyttsx3
                         self.tts_engine = pyttsx3.init()
                 except:
                     pass
                 continue
             
-            # Pause between items - ensure TTS finishes completely
-            time.sleep(2.5)  # Increased pause to ensure speech completes
+            # Pause between items
+            time.sleep(pause)
         
         # Menu choices: 1-4 = select item, 0 = repeat menu, 6 = cancel order
-        prompt = "Say 1, 2, 3, or 4 for your choice. Say 0 to hear the menu again. Say 6 to cancel your order. I am listening now."
+        prompt = MENU_PROMPT
         print(f"\n[{len(offers_to_announce) + 2}/{len(offers_to_announce) + 2}] Speaking prompt...")
         self.speak(prompt)
         
@@ -959,6 +1813,8 @@ class DriveThruSystem:
         selected_offer = None
         
         for attempt in range(max_attempts):
+            if self._cancel.is_set():
+                break
             # Listen for full order with longer timeout
             response = self.listen(timeout=self.config.get("voice_timeout", 15.0), phrase_time_limit=30)
             
@@ -971,11 +1827,7 @@ class DriveThruSystem:
             order_text = response
             
             # Try to extract menu number if mentioned (for tracking)
-            response_lower = response.lower()
-            for i in range(1, len(self.special_offers) + 1):
-                if str(i) in response_lower or self._number_to_word(i) in response_lower:
-                    selected_offer = i
-                    break
+            selected_offer = self._find_menu_number(response)
             
             # Confirm what we heard
             if attempt < max_attempts - 1:
@@ -985,20 +1837,19 @@ class DriveThruSystem:
                 confirmation = self.listen(timeout=5.0, phrase_time_limit=15)
                 if confirmation:
                     conf_lower = confirmation.lower()
-                    if any(word in conf_lower for word in ["yes", "correct", "right", "that's it", "that's all"]):
+                    if _ORDER_YES_RE.search(conf_lower):
                         # Customer confirmed, check if they want to add more
                         self.speak("Great! Is there anything else you'd like to add to your order?")
                         additional = self.listen(timeout=5.0, phrase_time_limit=15)
                         if additional:
-                            add_lower = additional.lower()
-                            if any(word in add_lower for word in ["no", "that's all", "nothing", "no thanks", "that's it"]):
+                            if _NOTHING_MORE_RE.search(additional.lower()):
                                 break
                             else:
                                 # Add to order
                                 order_text += ". " + additional
                                 break
                         break
-                    elif any(word in conf_lower for word in ["no", "wrong", "change"]):
+                    elif _ORDER_WRONG_RE.search(conf_lower):
                         self.speak("No problem. Please tell me your order again.")
                         continue
                     else:
@@ -1014,26 +1865,52 @@ class DriveThruSystem:
             "order_phrases": order_text.split(". ") if order_text else []
         }
     
+    @_on_voice_thread
+    def listen_menu_choice(self, timeout: float = 15.0, phrase_time_limit: int = 30) -> Optional[str]:
+        """
+        Listen for a menu choice (0-6 / repeat). With "use_vosk_menu_choice", Vosk decodes against just the
+        choice words (a few ms on a Pi, and robust to engine noise) instead of running Whisper; otherwise listen().
+        """
+        if self._cancel.is_set():
+            return None
+        if self.microphone is not None and self._ensure_vosk(for_keywords=True) is not None:
+            print(f"\n🎤 [LISTENING NOW - menu choice] Say your number... (Timeout: {timeout}s)")
+            try:
+                text = self._listen_streaming(timeout, phrase_time_limit, grammar=MENU_CHOICE_GRAMMAR)
+            except sr.WaitTimeoutError:
+                print("\n⏱ [TIMEOUT] No speech detected within timeout period\n")
+                return None
+            except sr.UnknownValueError:
+                print("\n❌ [ERROR] Could not understand audio\n")
+                return None
+            if text is not None:
+                text = " ".join(word for word in text.split() if word != "[unk]")
+                print(f"\n✓ [CUSTOMER SAID - keywords]: {text or '(no menu choice)'}\n")
+                return text or None
+        return self.listen(timeout=timeout, phrase_time_limit=phrase_time_limit)
+    
     def get_customer_order_simple(self) -> Dict[str, any]:
         """Simple flow: 1-5 = select item, 0 = repeat menu, 6 = cancel order. Timer starts when car on sensor (caller)."""
         menu_choices = 4
         max_repeats = 3
         for _ in range(max_repeats + 1):
+            if self._cancel.is_set():
+                break
             # Prompt already spoken by announce_offers; listen for choice
-            response = self.listen(timeout=self.config.get("voice_timeout", 15.0), phrase_time_limit=30)
+            response = self.listen_menu_choice(timeout=self.config.get("voice_timeout", 15.0), phrase_time_limit=30)
             order_text = response.strip() if response else None
             if not order_text:
-                self.speak("Say 1, 2, 3, 4, or 5 to order. Say 0 to repeat the menu. Say 6 to cancel. I am listening now.")
+                self.speak(CHOICE_REPROMPT)
                 continue
             response_lower = order_text.lower().strip()
             # 0 = repeat menu
             if str(0) in response_lower or "zero" in response_lower or ("repeat" in response_lower and len(response_lower) < 15):
-                self.speak("Repeating the menu.")
+                self.speak(MENU_REPEAT)
                 self.announce_offers()
                 continue
             # 6 = cancel order
             if str(6) in response_lower or "six" in response_lower:
-                self.speak("Order cancelled.")
+                self.speak(ORDER_CANCELLED)
                 return {
                     "full_order_text": None,
                     "selected_offer": None,
@@ -1043,19 +1920,14 @@ class DriveThruSystem:
                     "cancelled": True,
                 }
             # 1-5 = select menu item
-            selected_offer = None
-            for i in range(1, menu_choices + 1):
-                if str(i) in response_lower or self._number_to_word(i) in response_lower:
-                    selected_offer = i
-                    break
+            selected_offer = self._find_menu_number(response_lower, menu_choices)
             if selected_offer is None:
-                self.speak("Say 1, 2, 3, 4, or 5 for your choice. Say 0 to hear the menu again. Say 6 to cancel. I am listening now.")
+                self.speak(CHOICE_RETRY)
                 continue
             self._car_number += 1
             car_num = self._number_to_word(self._car_number)
             self.speak(f"Order confirmed. Car number {car_num}.")
-            offers = self.special_offers[:menu_choices] if self.special_offers else []
-            order_display = offers[selected_offer - 1] if selected_offer and offers else order_text
+            order_display = self._menu[selected_offer - 1].raw if selected_offer <= len(self._menu) else order_text
             return {
                 "full_order_text": order_display,
                 "selected_offer": selected_offer,
@@ -1092,20 +1964,14 @@ class DriveThruSystem:
         full_order = ". ".join(phrases)
         
         # Try to extract menu number if mentioned
-        selected_offer = None
-        full_order_lower = full_order.lower()
-        for i in range(1, len(self.special_offers) + 1):
-            if str(i) in full_order_lower or self._number_to_word(i) in full_order_lower:
-                selected_offer = i
-                break
+        selected_offer = self._find_menu_number(full_order)
         
         # Confirm order
         self.speak(f"I captured your order. Let me repeat it back: {full_order}. Is that correct?")
         confirmation = self.listen(timeout=5.0)
         
         if confirmation:
-            conf_lower = confirmation.lower()
-            if any(word in conf_lower for word in ["no", "wrong", "change", "not quite"]):
+            if _ORDER_WRONG_RE.search(confirmation.lower()):
                 self.speak("No problem. Let me connect you with our team member who can help clarify your order.")
             else:
                 self.speak("Perfect! I've captured your order.")
@@ -1135,36 +2001,63 @@ Extract and format the customer's order clearly.
 Customer said: "{order_text}"
 Return only the formatted order, nothing else."""
             
+            processed = None
+            if self._ollama_http and self._loop:
+                # Called from the voice thread: run the streamed request on the event loop and wait for it
+                future = asyncio.run_coroutine_threadsafe(self._generate_ollama_stream(model_name, prompt), self._loop)
+                processed = future.result(timeout=120)
             # Use Ollama client
-            if self.ollama_client:
-                response = self.ollama_client.generate(
+            elif self.ollama_client:
+                parts = []
+                for chunk in self.ollama_client.generate(
                     model=model_name,
-                    prompt=prompt
-                )
-                
-                # Extract response text
-                if isinstance(response, dict):
-                    processed = response.get('response', '').strip()
-                else:
-                    processed = str(response).strip()
-                
-                if processed and processed.lower() != order_text.lower():
-                    print(f"  [Ollama processed]: {processed}")
-                    return processed
+                    prompt=prompt,
+                    stream=True,
+                    keep_alive=self.config.get("ollama_keep_alive", "1h"),
+                    options=OLLAMA_GENERATE_OPTIONS,
+                ):
+                    parts.append(chunk['response'])
+                processed = "".join(parts).strip()
+            
+            if processed and processed.lower() != order_text.lower():
+                print(f"  [Ollama processed]: {processed}")
+                return processed
             return order_text
         except Exception as e:
             print(f"  ⚠ Ollama processing error: {e}")
             return order_text
     
+    async def _generate_ollama_stream(self, model_name: str, prompt: str) -> str:
+        """Stream /api/generate over the pooled client and return the joined response text."""
+        parts = []
+        async with self._ollama_http.stream(
+            "POST", "/api/generate", json={"model": model_name, "prompt": prompt, "stream": True,
+                                           "keep_alive": self.config.get("ollama_keep_alive", "1h"),
+                                           "options": OLLAMA_GENERATE_OPTIONS}
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                parts.append(chunk.get("response", ""))
+                if chunk.get("done"):
+                    break
+        return "".join(parts).strip()
+    
+    def _find_menu_number(self, text: str, limit: Optional[int] = None) -> Optional[int]:
+        """First menu number said in text ("2" or "two", as a whole word), up to limit; None if there is none."""
+        if self._menu_num_re is None:
+            return None
+        for match in self._menu_num_re.finditer(text):
+            num = self._word_to_num[match.group(1).lower()]
+            if limit is None or num <= limit:
+                return num
+        return None
+    
     def _number_to_word(self, num: int) -> str:
         """Convert number to word for better recognition (0=repeat, 1-5=menu, 6=cancel)."""
-        words = {
-            0: "zero",
-            1: "one", 2: "two", 3: "three", 4: "four",
-            5: "five", 6: "six", 7: "seven", 8: "eight",
-            9: "nine", 10: "ten"
-        }
-        return words.get(num, str(num))
+        return _NUM_WORDS.get(num, str(num))
     
     def handoff_to_operator(self, customer_id: str, order_data: Dict[str, any]):
         """Hand off to human operator with full order transcript; order displayed on screen, human prepares, car goes to pick-up."""
@@ -1184,12 +2077,13 @@ Return only the formatted order, nothing else."""
             "full_order_text": full_order_text,
             "order_phrases": order_data.get("order_phrases", []),
             "selected_offer": selected_offer,
-            "offer_details": self.special_offers[selected_offer - 1] if selected_offer else None,
+            "offer_details": self._menu[selected_offer - 1].raw if selected_offer and selected_offer <= len(self._menu) else None,
             "status": "ready_for_operator"
         }
         
         # Add to order queue
-        self.order_queue.put(handoff_info)
+        self.order_queue.append(handoff_info)
+        self._order_event.set()
         
         # Notify operator
         if self.config.get("operator_notification", True):
@@ -1199,7 +2093,7 @@ Return only the formatted order, nothing else."""
         if full_order_text:
             self.speak(f"Thank you! Your order is on the screen. Our team is preparing it. Please drive to the pick-up window to collect your order and pay.")
         else:
-            self.speak("Please drive to the pick-up window. Our team will help you there.")
+            self.speak(PICKUP_PROMPT)
         
         print(f"\n{'='*60}")
         print(f"OPERATOR HANDOFF - Customer ID: {customer_id}")
@@ -1220,6 +2114,20 @@ Return only the formatted order, nothing else."""
         self.speak_order("Your order is. " + full_order_text)
         return self.handoff_to_operator(customer_id, order_data)
     
+    def next_order(self, timeout: Optional[float] = None) -> Optional[Dict]:
+        """Oldest handoff waiting for the operator, blocking up to timeout seconds; None if none arrived."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return self.order_queue.popleft()
+            except IndexError:
+                pass
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return None
+            self._order_event.wait(remaining)
+            self._order_event.clear()
+    
     def _notify_operator(self, handoff_info: Dict):
         """Notify human operator with full order transcript"""
         # This could trigger:
@@ -1239,7 +2147,69 @@ Return only the formatted order, nothing else."""
             for i, phrase in enumerate(handoff_info['order_phrases'], 1):
                 print(f"   {i}. {phrase}")
         print()
+        
+        # POS/database side is batched: the drainer thread sends buffered orders in one request
+        if self._pos_endpoint:
+            with self._notify_lock:
+                self._notify_buffer.append(handoff_info)
+                self._cap_notify_buffer()
+                full = len(self._notify_buffer) >= 10
+            if full:
+                self._notify_wake.set()
+    
+    def _cap_notify_buffer(self):
+        """Keep at most "pos_buffer_max" unsent notifications in memory; older ones are appended to
+        "pos_spill_file" (one JSON object per line) for replay by hand. Call with _notify_lock held."""
+        excess = len(self._notify_buffer) - self.config.get("pos_buffer_max", 500)
+        if excess <= 0:
+            return
+        spilled, self._notify_buffer = self._notify_buffer[:excess], self._notify_buffer[excess:]
+        spill_file = self.config.get("pos_spill_file", "pos_unsent.jsonl")
+        try:
+            with open(spill_file, "a", encoding="utf-8") as f:
+                for info in spilled:
+                    f.write(json.dumps(info, default=str) + "\n")
+        except OSError as e:
+            print(f"⚠ Could not save {len(spilled)} unsent POS notifications to {spill_file}: {e}")
     
+    def _notify_drainer(self):
+        """Send buffered operator notifications to the POS endpoint every 0.5 s (sooner once 10 are waiting).
+        While the endpoint is failing, retries back off exponentially up to "pos_retry_max_s"; only the first
+        failure and the recovery are logged."""
+        delay = 0.5
+        failed_since = None  # time of the first failure in the current outage
+        while True:
+            if failed_since is None:
+                self._notify_wake.wait(delay)
+            else:
+                time.sleep(delay)  # backing off: a full buffer doesn't cut the wait short
+            self._notify_wake.clear()
+            with self._notify_lock:
+                batch, self._notify_buffer = self._notify_buffer, []
+            if not batch:
+                continue
+            body = json.dumps({"requests": batch}, default=str).encode("utf-8")
+            request = urllib.request.Request(self._pos_endpoint, data=body, method="POST",
+                                             headers={"Content-Type": "application/json"})
+            try:
+                with urllib.request.urlopen(request, timeout=5) as response:
+                    response.read()
+            except Exception as e:
+                if failed_since is None:
+                    failed_since = time.monotonic()
+                    print(f"⚠ POS notification failed ({len(batch)} orders, retrying in the background): {e}")
+                delay = min(delay * 2, self.config.get("pos_retry_max_s", 60.0))
+                with self._notify_lock:
+                    self._notify_buffer[:0] = batch
+                    self._cap_notify_buffer()
+                continue
+            if failed_since is not None:
+                print(f"✓ POS notifications delivered again after {time.monotonic() - failed_since:.0f}s "
+                      f"({len(batch)} orders sent)")
+                failed_since = None
+                delay = 0.5
+    
+    @_on_voice_thread
     def process_customer(self):
         """Process a single customer: trigger → read menu → listen → register order → read back order (different voice)."""
         customer_id = f"CUST_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
@@ -1255,7 +2225,7 @@ Return only the formatted order, nothing else."""
             # SIMPLE: 1. Read menu  2. Listen once  3. Register order  4. Read back order (different voice)
             self.announce_offers()
             order_data = self.get_customer_order_simple()
-            handoff_info = self.handoff_to_operator_simple(customer_id, order_data)
+            handoff = self.handoff_to_operator_simple
         else:
             # Full flow (continuous listen, confirmations)
             self.announce_offers()
@@ -1264,14 +2234,19 @@ Return only the formatted order, nothing else."""
                 order_data = self.get_customer_order_continuous()
             else:
                 order_data = self.get_customer_order()
-            handoff_info = self.handoff_to_operator(customer_id, order_data)
+            handoff = self.handoff_to_operator
         
         self.current_customer = None
-        return handoff_info
+        if self._cancel.is_set():
+            print(f"Customer {customer_id} interrupted by shutdown: no order handed off")
+            return None
+        return handoff(customer_id, order_data)
     
-    def run(self):
-        """Main loop - continuously monitors for car approach via loop detector"""
+    async def run(self):
+        """Main loop - waits for car approach via loop detector (start with asyncio.run(system.run()))"""
         self.running = True
+        self._loop = asyncio.get_running_loop()
+        self.car_events = asyncio.Queue()
         print("\n" + "="*60)
         print("KFC DRIVE-THROUGH SYSTEM STARTED")
         print("Monitoring loop detector for car approach...")
@@ -1282,36 +2257,74 @@ Return only the formatted order, nothing else."""
         print("Press Ctrl+C to stop")
         print("="*60 + "\n")
         
+        # Load and warm Whisper on the voice thread while no car is waiting (not awaited: the lane stays live)
+        if self.use_whisper:
+            self._loop.run_in_executor(self._voice_pool, self._warm_whisper)
+        
         car_detected = False
+        poll_index = 0
+        # A car already on the loop at startup raises no edge
+        if self._edge_detect and self.detect_car_approach():
+            self._on_car_detected(self.loop_pin)
         
         try:
             while self.running:
+                if self._edge_detect:
+                    # Sleep until the loop detector interrupt reports a car (or stop() posts "stop"): no wake-ups while idle
+                    event, _ = await self.car_events.get()
+                    if event == "stop":
+                        break
+                    self._record_arrival()
+                    await self.process_customer_async()
+                    self._drain_car_events()
+                    print("\nReady for next customer.\n")
+                    continue
+                
                 # Check for car approach
                 if self.detect_car_approach():
                     if not car_detected:
                         # Car just arrived
                         car_detected = True
+                        self._record_arrival()
                         # Process customer
-                        self.process_customer()
+                        await self.process_customer_async()
                         print("\nWaiting for car to leave detection zone...\n")
+                    poll_index = 0
+                    await asyncio.sleep(self._poll_schedule[-1])
                 else:
                     # Car has left or no car present
                     if car_detected:
                         car_detected = False
                         print("Car left detection zone. Ready for next customer.\n")
-                    # No car detected, check again soon
-                    time.sleep(0.2)
+                    # No car detected: next delay from the fitted schedule (time since the last car)
+                    await asyncio.sleep(self._poll_schedule[min(poll_index, len(self._poll_schedule) - 1)])
+                    poll_index += 1
         
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, asyncio.CancelledError):
             print("\n\nShutting down KFC drive-through system...")
             self.running = False
         finally:
+            # Don't wait out the current car: its listen/speak steps see _cancel and return, and a car
+            # queued behind it on the voice thread is dropped
+            self._cancel.set()
+            self._voice_pool.shutdown(wait=False, cancel_futures=True)
+            if self._ollama_http:
+                await self._ollama_http.aclose()
+                self._ollama_http = None
+            self._loop = None
             if GPIO_AVAILABLE:
                 GPIO.cleanup()
     
     def stop(self):
         """Stop the drive-through system"""
         self.running = False
+        # Wake run() if it is waiting on the edge interrupt; callable from any thread
+        loop = self._loop
+        if loop is not None:
+            try:
+                loop.call_soon_threadsafe(self.car_events.put_nowait, ("stop", time.time()))
+            except RuntimeError:
+                pass  # event loop already closed
 
 
 def main():
@@ -1328,7 +2341,10 @@ def main():
         print("Please check that config.json contains 'special_offers' array.\n")
     
     # Start system
-    system.run()
+    try:
+        asyncio.run(system.run())
+    except KeyboardInterrupt:
+        pass
 
 
 if __name__ == "__main__":
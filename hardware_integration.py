@@ -1,113 +1,133 @@
 """
 Hardware Integration Examples
 Replace the simulated detect_car_approach() with actual hardware interfaces
-"""
 
-# Example 1: Raspberry Pi GPIO Integration
+Each detector imports its own hardware library when it is created, so using one backend never loads the
+others (OpenCV alone takes hundreds of ms to import). Pick one with make_detector("gpio" | "arduino" |
+"camera" | "ultrasonic", ...).
 """
-import RPi.GPIO as GPIO
 
+import time
+
+
+# Example 1: Raspberry Pi GPIO Integration
 class RaspberryPiLoopDetector:
     def __init__(self, pin_number=18):
+        import RPi.GPIO as GPIO
+        self.GPIO = GPIO
         self.pin = pin_number
         GPIO.setmode(GPIO.BCM)
         GPIO.setup(self.pin, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
-    
+
     def detect_car(self):
-        return GPIO.input(self.pin) == GPIO.HIGH
-"""
+        return self.GPIO.input(self.pin) == self.GPIO.HIGH
 
-# Example 2: Arduino Serial Communication
-"""
-import serial
 
+# Example 2: Arduino Serial Communication
 class ArduinoLoopDetector:
     def __init__(self, port='COM3', baudrate=9600):
+        import serial
         self.serial = serial.Serial(port, baudrate)
-    
+
     def detect_car(self):
         if self.serial.in_waiting > 0:
             data = self.serial.readline().decode().strip()
             return data == "CAR_DETECTED"
         return False
-"""
 
-# Example 3: Camera-based Detection (OpenCV)
-"""
-import cv2
-import numpy as np
 
+# Example 3: Camera-based Detection (OpenCV)
 class CameraCarDetector:
     def __init__(self, camera_index=0):
+        import cv2
+        self.cv2 = cv2
         self.cap = cv2.VideoCapture(camera_index)
         self.background_subtractor = cv2.createBackgroundSubtractorMOG2()
-    
+
     def detect_car(self):
+        cv2 = self.cv2
         ret, frame = self.cap.read()
         if not ret:
             return False
-        
+
         # Apply background subtraction
         fg_mask = self.background_subtractor.apply(frame)
-        
+
         # Detect motion/objects
         contours, _ = cv2.findContours(fg_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        
+
         # If large contour detected, car is present
         for contour in contours:
             area = cv2.contourArea(contour)
             if area > 5000:  # Threshold for car size
                 return True
-        
+
         return False
-"""
 
-# Example 4: Ultrasonic Sensor (Distance-based)
-"""
-import RPi.GPIO as GPIO
-import time
 
+# Example 4: Ultrasonic Sensor (Distance-based)
 class UltrasonicCarDetector:
     def __init__(self, trigger_pin=23, echo_pin=24):
+        import RPi.GPIO as GPIO
+        self.GPIO = GPIO
         self.trigger = trigger_pin
         self.echo = echo_pin
         GPIO.setmode(GPIO.BCM)
         GPIO.setup(self.trigger, GPIO.OUT)
         GPIO.setup(self.echo, GPIO.IN)
-    
+
     def get_distance(self):
+        GPIO = self.GPIO
         GPIO.output(self.trigger, False)
         time.sleep(0.00001)
         GPIO.output(self.trigger, True)
         time.sleep(0.00001)
         GPIO.output(self.trigger, False)
-        
+
+        pulse_start = pulse_end = time.time()
         while GPIO.input(self.echo) == 0:
             pulse_start = time.time()
-        
+
         while GPIO.input(self.echo) == 1:
             pulse_end = time.time()
-        
+
         pulse_duration = pulse_end - pulse_start
         distance = pulse_duration * 17150  # Speed of sound
         return round(distance, 2)
-    
+
     def detect_car(self, threshold_distance=50):
         distance = self.get_distance()
         return distance < threshold_distance  # Car within threshold
-"""
+
+
+_DETECTORS = {
+    "gpio": RaspberryPiLoopDetector,
+    "arduino": ArduinoLoopDetector,
+    "camera": CameraCarDetector,
+    "ultrasonic": UltrasonicCarDetector,
+}
+
+
+def make_detector(kind: str, **kwargs):
+    """Create the detector for kind ("gpio", "arduino", "camera", "ultrasonic"); only its library is imported."""
+    try:
+        cls = _DETECTORS[kind]
+    except KeyError:
+        raise ValueError(f"Unknown detector {kind!r}; choose from {', '.join(_DETECTORS)}") from None
+    return cls(**kwargs)
+
 
 # Example 5: Integration with drive_thru_system.py
 """
 # In drive_thru_system.py, replace detect_car_approach() with:
 
-from hardware_integration import RaspberryPiLoopDetector
+from hardware_integration import make_detector
 
 class DriveThruSystem:
     def __init__(self, config_file: str = "config.json"):
         # ... existing code ...
-        self.loop_detector = RaspberryPiLoopDetector(pin_number=18)
-    
+        self.loop_detector = make_detector("gpio", pin_number=18)
+
     def detect_car_approach(self) -> bool:
         return self.loop_detector.detect_car()
 """
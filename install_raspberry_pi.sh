@@ -18,6 +18,17 @@ pip3 install pyttsx3 || echo "pyttsx3 installation failed, using espeak instead"
 # Install PyAudio dependencies
 sudo apt-get install -y portaudio19-dev python3-pyaudio
 
+# Optional: Whisper speech recognition ("use_ollama_whisper": true in config.json).
+# The model is converted to int8 CTranslate2 once here, so the system loads it from models/ instead of
+# quantizing at every start-up (the converter needs transformers + torch; the system itself does not)
+pip3 install faster-whisper || echo "faster-whisper installation failed, using Google Speech Recognition"
+if python3 -c "import ctranslate2, transformers" 2>/dev/null; then
+    ct2-transformers-converter --model openai/whisper-tiny.en --output_dir models/whisper-tiny.en-int8 \
+        --copy_files tokenizer.json preprocessor_config.json --quantization int8
+else
+    echo "Skipping Whisper int8 conversion (pip3 install transformers torch, then re-run); the model downloads on first use"
+fi
+
 echo ""
 echo "Installation complete!"
 echo ""
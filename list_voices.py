@@ -1,48 +1,49 @@
 """
 List all available Windows SAPI voices
+(from a snapshot saved by the last run; pass --refresh after installing new voices)
 """
 
 import platform
+import sys
 
-if platform.system() != "Windows":
-    print("This script is for Windows only")
-    exit(1)
 
-print("="*70)
-print("AVAILABLE WINDOWS SAPI VOICES")
-print("="*70)
-
-try:
-    import win32com.client
-    speaker = win32com.client.Dispatch("SAPI.SpVoice")
-    
-    # Get all voices
-    voices = speaker.GetVoices()
+def main():
+    if platform.system() != "Windows":
+        print("This script is for Windows only")
+        exit(1)
     
-    print(f"\nFound {voices.Count} voices:\n")
+    print("="*70)
+    print("AVAILABLE WINDOWS SAPI VOICES")
+    print("="*70)
     
-    for i in range(voices.Count):
-        voice = voices.Item(i)
-        voice_id = voice.Id
-        voice_name = voice.GetDescription()
+    try:
+        from sapi_util import list_voices_cached
         
-        # Get voice attributes
-        attributes = voice.GetAttribute("Gender")
-        language = voice.GetAttribute("Language")
+        # Every COM property is read up front (or taken from the saved snapshot), then printed from plain values
+        voice_data = list_voices_cached(refresh="--refresh" in sys.argv)
         
-        print(f"{i+1}. {voice_name}")
-        print(f"   ID: {voice_id}")
-        print(f"   Gender: {attributes}")
-        print(f"   Language: {language}")
-        print()
-    
-    print("="*70)
-    print("\nTo use a specific voice, note the voice name or ID above.")
-    print("Female voices are typically marked with 'Female' in Gender.")
-    
-except ImportError:
-    print("ERROR: win32com not available. Install with: pip install pywin32")
-except Exception as e:
-    print(f"ERROR: {e}")
-    import traceback
-    traceback.print_exc()
+        print(f"\nFound {len(voice_data)} voices:\n")
+        
+        # The whole listing is built first and written once
+        out = []
+        for i, (_, voice_name, voice_id, gender, language, error) in enumerate(voice_data, 1):
+            if error is not None:
+                out.append(f"{i}. (could not read voice: {error})\n\n")
+                continue
+            out.append(f"{i}. {voice_name}\n   ID: {voice_id}\n   Gender: {gender}\n   Language: {language}\n\n")
+        sys.stdout.write("".join(out))
+        
+        print("="*70)
+        print("\nTo use a specific voice, note the voice name or ID above.")
+        print("Female voices are typically marked with 'Female' in Gender.")
+        
+    except ImportError:
+        print("ERROR: win32com not available. Install with: pip install pywin32")
+    except Exception as e:
+        print(f"ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Shared Windows SAPI access for the voice scripts (list_voices.py, select_kenya_voice.py)
+"""
+
+import functools
+import json
+import os
+import platform
+from collections import namedtuple
+
+import win32com.client
+
+# One installed voice, read from COM once; error is set (and the rest None) if the voice couldn't be read.
+# token is the live SAPI token, None for voices loaded from the disk snapshot (see voice_token)
+VoiceInfo = namedtuple("VoiceInfo", "token name id gender language error")
+
+VOICES_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "drive_thru", "voices.json")
+
+
+@functools.lru_cache(maxsize=1)
+def get_speaker():
+    """The process's SAPI.SpVoice (the SAPI engine starts once, however many scripts use it)."""
+    return win32com.client.Dispatch("SAPI.SpVoice")
+
+
+@functools.lru_cache(maxsize=1)
+def get_voices():
+    """Every installed voice as a VoiceInfo, all COM properties read in one pass."""
+    voices = get_speaker().GetVoices()
+    out = []
+    for i in range(voices.Count):
+        try:
+            voice = voices.Item(i)
+            out.append(VoiceInfo(voice, voice.GetDescription(), voice.Id,
+                                 voice.GetAttribute("Gender"), voice.GetAttribute("Language"), None))
+        except Exception as e:
+            out.append(VoiceInfo(None, None, None, None, None, e))
+    return tuple(out)
+
+
+def list_voices_cached(refresh: bool = False):
+    """get_voices() from the JSON snapshot in VOICES_CACHE, enumerating through COM (and rewriting the snapshot)
+    only when it is missing, was taken on another Windows version, or refresh is set."""
+    key = list(platform.win32_ver())
+    if not refresh:
+        try:
+            with open(VOICES_CACHE, "r") as f:
+                data = json.load(f)
+            if data.get("key") == key:
+                return tuple(VoiceInfo(None, *v) for v in data["voices"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+    voices = get_voices()
+    if any(v.error is not None for v in voices):
+        return voices  # don't keep a snapshot with unreadable voices in it
+    try:
+        os.makedirs(os.path.dirname(VOICES_CACHE), exist_ok=True)
+        with open(VOICES_CACHE, "w") as f:
+            json.dump({"key": key, "voices": [[v.name, v.id, v.gender, v.language, None] for v in voices]}, f)
+    except OSError:
+        pass  # the snapshot is only a shortcut for the next run
+    return voices
+
+
+def voice_token(info: VoiceInfo):
+    """The SAPI token for a VoiceInfo (looked up by its Id when it came from the snapshot)."""
+    if info.token is not None:
+        return info.token
+    token = win32com.client.Dispatch("SAPI.SpObjectToken")
+    token.SetId(info.id)
+    return token
@@ -1,120 +1,135 @@
 """
 Script to help select and configure a Kenya lady voice
+(voices are listed from a snapshot saved by the last run; pass --refresh after installing new voices)
 """
 
 import platform
 import json
+import re
+import sys
 
-if platform.system() != "Windows":
-    print("This script is for Windows only")
-    exit(1)
+# Voice classifiers, one regex scan each over the lowercased name (and language)
+_FEMALE_RE = re.compile(r"female|woman")
+_KENYA_RE = re.compile(r"kenya|africa|\bke\b")
 
-print("="*70)
-print("KENYA LADY VOICE SELECTION")
-print("="*70)
 
-try:
-    import win32com.client
-    speaker = win32com.client.Dispatch("SAPI.SpVoice")
-    
-    # Get all voices
-    voices = speaker.GetVoices()
-    
-    print(f"\nFound {voices.Count} available voices:\n")
+def classify_voice(name: str, gender: str, language: str):
+    """(is_female, is_kenyan) for one voice's description, Gender and Language attributes."""
+    name_lower = name.lower()
+    is_female = gender == "Female" or bool(_FEMALE_RE.search(name_lower))
+    is_kenyan = bool(_KENYA_RE.search(name_lower + " " + language.lower()))
+    return is_female, is_kenyan
+
+
+def main():
+    if platform.system() != "Windows":
+        print("This script is for Windows only")
+        exit(1)
     
-    female_voices = []
-    kenyan_voices = []
+    print("="*70)
+    print("KENYA LADY VOICE SELECTION")
+    print("="*70)
     
-    for i in range(voices.Count):
-        voice = voices.Item(i)
-        voice_name = voice.GetDescription()
-        voice_id = voice.Id
-        gender = voice.GetAttribute("Gender")
-        language = voice.GetAttribute("Language")
+    try:
+        from sapi_util import get_speaker, list_voices_cached, voice_token
+        speaker = get_speaker()
         
-        is_female = "female" in voice_name.lower() or "woman" in voice_name.lower() or gender == "Female"
-        is_kenyan = "ke" in language.lower() or "kenya" in voice_name.lower() or "africa" in voice_name.lower()
+        # Get all voices (the snapshot from the last run, or read from COM once; --refresh re-reads)
+        voices = list_voices_cached(refresh="--refresh" in sys.argv)
         
-        if is_female:
-            female_voices.append((i, voice_name, language, voice_id))
-        if is_kenyan:
-            kenyan_voices.append((i, voice_name, language, voice_id))
+        print(f"\nFound {len(voices)} available voices:\n")
         
-        status = ""
-        if is_female and is_kenyan:
-            status = " ⭐ FEMALE + KENYAN"
-        elif is_female:
-            status = " ♀ FEMALE"
-        elif is_kenyan:
-            status = " 🇰🇪 KENYAN"
+        female_voices = []  # first three only: all the recommendation shows
+        best = None  # first female + Kenyan voice
         
-        print(f"{i+1}. {voice_name}{status}")
-        print(f"   Language: {language}")
-        print()
-    
-    # Recommend best voice
-    print("="*70)
-    print("RECOMMENDATIONS:")
-    print("="*70)
-    
-    if kenyan_voices:
-        print("\n⭐ BEST OPTION: Kenyan female voice found!")
-        for idx, name, lang, vid in kenyan_voices:
-            if "female" in name.lower() or "woman" in name.lower():
-                print(f"\nRecommended: {name}")
-                print(f"Language: {lang}")
-                print(f"\nTo use this voice, update config.json:")
-                print(f'  "voice_name": "{name}"')
-                break
-    elif female_voices:
-        print("\n✓ FEMALE VOICES AVAILABLE:")
-        for idx, name, lang, vid in female_voices[:3]:  # Show first 3
-            print(f"  - {name} ({lang})")
+        out = []  # the listing is written once, after the loop
+        for i, (_, voice_name, voice_id, gender, language, error) in enumerate(voices):
+            if error is not None:
+                out.append(f"{i+1}. (could not read voice: {error})\n\n")
+                continue
+            is_female, is_kenyan = classify_voice(voice_name, gender, language)
+            
+            if is_female and len(female_voices) < 3:
+                female_voices.append((voices[i], voice_name, language, voice_id))
+            if is_female and is_kenyan and best is None:
+                best = (voices[i], voice_name, language, voice_id)
+            
+            status = ""
+            if is_female and is_kenyan:
+                status = " ⭐ FEMALE + KENYAN"
+            elif is_female:
+                status = " ♀ FEMALE"
+            elif is_kenyan:
+                status = " 🇰🇪 KENYAN"
+            
+            out.append(f"{i+1}. {voice_name}{status}\n   Language: {language}\n\n")
+        sys.stdout.write("".join(out))
         
-        print(f"\nRecommended: {female_voices[0][1]}")
-        print(f"\nTo use this voice, update config.json:")
-        print(f'  "voice_name": "{female_voices[0][1]}"')
-    else:
-        print("\n⚠ No female voices found. Using default voice.")
-    
-    # Test selected voice
-    print("\n" + "="*70)
-    print("TESTING VOICE")
-    print("="*70)
-    
-    if female_voices:
-        test_voice = female_voices[0]
-        speaker.Voice = voices.Item(test_voice[0])
-        print(f"\nTesting voice: {test_voice[1]}")
-        print("Speaking: 'Hello, welcome to KFC drive-through'")
-        speaker.Speak("Hello, welcome to KFC drive-through", 0)
-        print("\nDid you like this voice?")
+        # Recommend best voice
+        print("="*70)
+        print("RECOMMENDATIONS:")
+        print("="*70)
         
-        # Update config.json
-        try:
-            with open("config.json", "r") as f:
-                config = json.load(f)
-            
-            config["voice_name"] = test_voice[1]
-            config["voice_preference"] = "female"
+        if best:
+            token, name, lang, vid = best
+            print("\n⭐ BEST OPTION: Kenyan female voice found!")
+            print(f"\nRecommended: {name}")
+            print(f"Language: {lang}")
+            print(f"\nTo use this voice, update config.json:")
+            print(f'  "voice_name": "{name}"')
+        elif female_voices:
+            print("\n✓ FEMALE VOICES AVAILABLE:")
+            for token, name, lang, vid in female_voices:
+                print(f"  - {name} ({lang})")
             
-            with open("config.json", "w") as f:
-                json.dump(config, f, indent=2)
+            print(f"\nRecommended: {female_voices[0][1]}")
+            print(f"\nTo use this voice, update config.json:")
+            print(f'  "voice_name": "{female_voices[0][1]}"')
+        else:
+            print("\n⚠ No female voices found. Using default voice.")
+        
+        # Test selected voice
+        print("\n" + "="*70)
+        print("TESTING VOICE")
+        print("="*70)
+        
+        if female_voices:
+            test_voice = female_voices[0]
+            speaker.Voice = voice_token(test_voice[0])
+            print(f"\nTesting voice: {test_voice[1]}")
+            print("Speaking: 'Hello, welcome to KFC drive-through'")
+            speaker.Speak("Hello, welcome to KFC drive-through", 0)
+            print("\nDid you like this voice?")
             
-            print(f"\n✓ Updated config.json to use: {test_voice[1]}")
-        except Exception as e:
-            print(f"\n⚠ Could not update config.json: {e}")
-            print("Please manually update config.json with:")
-            print(f'  "voice_name": "{test_voice[1]}"')
+            # Update config.json
+            try:
+                with open("config.json", "r") as f:
+                    config = json.load(f)
+                
+                config["voice_name"] = test_voice[1]
+                config["voice_preference"] = "female"
+                
+                with open("config.json", "w") as f:
+                    json.dump(config, f, indent=2)
+                
+                print(f"\n✓ Updated config.json to use: {test_voice[1]}")
+            except Exception as e:
+                print(f"\n⚠ Could not update config.json: {e}")
+                print("Please manually update config.json with:")
+                print(f'  "voice_name": "{test_voice[1]}"')
+        
+    except ImportError:
+        print("ERROR: win32com not available. Install with: pip install pywin32")
+    except Exception as e:
+        print(f"ERROR: {e}")
+        import traceback
+        traceback.print_exc()
     
-except ImportError:
-    print("ERROR: win32com not available. Install with: pip install pywin32")
-except Exception as e:
-    print(f"ERROR: {e}")
-    import traceback
-    traceback.print_exc()
+    print("\n" + "="*70)
+    print("NOTE: Windows may not have Kenyan-specific voices by default.")
+    print("You may need to install additional language packs or voices.")
+    print("="*70)
+
 
-print("\n" + "="*70)
-print("NOTE: Windows may not have Kenyan-specific voices by default.")
-print("You may need to install additional language packs or voices.")
-print("="*70)
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,19 @@ No keyboard input. Say "hello" or "start" to begin, "goodbye" or "exit" to quit.
 """
 
 from drive_thru_system import DriveThruSystem
+import os
+import re
+import sys
 import time
 
+# Spoken intro only for a person at the terminal (not when run from a script/CI, or with DRIVE_THRU_SILENT set)
+INTERACTIVE = sys.stdin.isatty() and not os.environ.get("DRIVE_THRU_SILENT")
+
+# Voice commands: each wake/quit word maps to its action; the first one said (a whole word) is dispatched
+_COMMANDS = dict.fromkeys(("hello", "start", "ready", "here", "order", "hi", "yes"), "start")
+_COMMANDS.update(dict.fromkeys(("goodbye", "exit", "quit", "stop", "done", "bye"), "quit"))
+_COMMAND_RE = re.compile(r"\b(" + "|".join(_COMMANDS) + r")\b")
+
 def simulate_car_approach():
     """Voice-only simulation - listen for wake words to trigger"""
     print("="*60)
@@ -22,11 +33,33 @@ def simulate_car_approach():
     system.detect_car_approach = simulated_detect
     
     # Tell user they respond using voice
-    system.speak("Voice only mode. Respond using your voice. Say hello or start when you are ready to order. When I read the menu, say a number or say repeat. Say goodbye or exit when you are done.")
-    time.sleep(1)
+    if INTERACTIVE:
+        system.speak("Voice only mode. Respond using your voice. Say hello or start when you are ready to order. When I read the menu, say a number or say repeat. Say goodbye or exit when you are done.")
+        time.sleep(1)
     
     print("Respond using your voice. Say 'hello' or 'start' to begin, then say your order (e.g. number one). Say 'goodbye' or 'exit' to quit.\n")
     
+    # Start/trigger: hello, start, ready, I'm here, order, etc.
+    def start():
+        nonlocal car_present
+        print("--- Car approach triggered by voice ---")
+        car_present = True
+        system.process_customer()
+        car_present = False
+        print("Ready for next customer. Say 'hello' or 'start' again, or 'goodbye' to exit.\n")
+        time.sleep(1)
+        system.speak("Say hello or start when you want to order again. Say goodbye to exit.")
+        return True
+    
+    # Quit: goodbye, exit, quit, stop
+    def quit_():
+        system.speak("Goodbye. Have a nice day.")
+        print("\nExiting (voice command).\n")
+        return False
+    
+    handlers = {"start": start, "quit": quit_}
+    last_unknown = ("", 0.0)  # last unrecognized phrase and when it was heard
+    
     try:
         while True:
             # Listen for voice command - NO keyboard input
@@ -38,26 +71,21 @@ def simulate_car_approach():
                 continue
             
             said_lower = said.lower().strip()
-            print(f"You said: {said}\n")
-            
-            # Start/trigger: hello, start, ready, I'm here, order, etc.
-            if any(w in said_lower for w in ["hello", "start", "ready", "here", "order", "hi", "yes"]):
-                print("--- Car approach triggered by voice ---")
-                car_present = True
-                system.process_customer()
-                car_present = False
-                print("Ready for next customer. Say 'hello' or 'start' again, or 'goodbye' to exit.\n")
-                time.sleep(1)
-                system.speak("Say hello or start when you want to order again. Say goodbye to exit.")
+            if not said_lower:
                 continue
+            print(f"You said: {said}\n")
             
-            # Quit: goodbye, exit, quit, stop
-            if any(w in said_lower for w in ["goodbye", "exit", "quit", "stop", "done", "bye"]):
-                system.speak("Goodbye. Have a nice day.")
-                print("\nExiting (voice command).\n")
+            match = _COMMAND_RE.search(said_lower)
+            if match:
+                if handlers[_COMMANDS[match.group(1)]]():
+                    continue
                 break
             
-            # Unknown - ask to repeat
+            # Unknown - ask to repeat (not again for the same phrase within 5 s: usually recognizer noise)
+            now = time.monotonic()
+            if said_lower == last_unknown[0] and now - last_unknown[1] < 5.0:
+                continue
+            last_unknown = (said_lower, now)
             system.speak("Say hello or start to order, or goodbye to exit.")
             print("(Say 'hello' to order or 'goodbye' to exit)\n")
     
@@ -4,7 +4,6 @@ No keyboard input. All prompts are spoken and all answers are by voice.
 """
 
 from drive_thru_system import DriveThruSystem
-import time
 
 def print_section(title):
     print("\n" + "="*70)
@@ -15,6 +14,14 @@ def test_system():
     """Voice-only system test - no input() calls"""
     print_section("KFC DRIVE-THROUGH - VOICE ONLY TEST")
     
+    # Test 1: Menu loaded (config only, before TTS / microphone start-up)
+    print_section("TEST 1: Menu Loading")
+    menu_count = len(DriveThruSystem._load_config("config.json").get("special_offers", []))
+    if menu_count == 0:
+        print("❌ Error. No menu items loaded.")
+        return False
+    print(f"Menu items: {menu_count}")
+    
     print("\n[1] Initializing system...")
     try:
         system = DriveThruSystem()
@@ -25,19 +32,10 @@ def test_system():
         traceback.print_exc()
         return False
     
-    # Tell user they respond using voice
+    # Tell user they respond using voice (speak() returns once playback has finished: no waits needed)
     system.speak("This is a voice only test. Do not type anything. I will speak and you respond using your voice. Speak into your microphone when I ask.")
-    time.sleep(2)
     
-    # Test 1: Menu loaded
-    print_section("TEST 1: Menu Loading")
-    menu_count = len(system.special_offers)
-    if menu_count == 0:
-        system.speak("Error. No menu items loaded.")
-        return False
-    print(f"Menu items: {menu_count}")
     system.speak(f"Menu loaded. {menu_count} items.")
-    time.sleep(1)
     
     # Test 2: TTS
     print_section("TEST 2: Text to Speech")
@@ -45,7 +43,6 @@ def test_system():
         system.speak("Error. Text to speech not available.")
         return False
     system.speak("Hello. This is a voice test. Can you hear me?")
-    time.sleep(2)
     
     # Test 3: Voice recognition - listen for confirmation
     print_section("TEST 3: Voice Recognition")
@@ -60,20 +57,16 @@ def test_system():
             system.speak("Please check your speakers.")
     else:
         system.speak("I did not hear a response. Check your microphone.")
-    time.sleep(2)
     
     # Test 4: Menu announcement
     print_section("TEST 4: Menu Announcement")
     system.speak("I will now read the menu. Listen carefully.")
-    time.sleep(2)
     system.announce_offers()
-    time.sleep(1)
     
     # Test 5: Full flow (voice only)
     print_section("TEST 5: Full Voice Flow")
     print(">>> When the menu is read, respond using your voice: say a number (e.g. one, two) or 'repeat'.\n")
     system.speak("Starting full order flow. When I read the menu, respond using your voice. Say a number like one or two, or say repeat to hear the menu again. I will listen for your voice.")
-    time.sleep(2)
     
     try:
         handoff_info = system.process_customer()